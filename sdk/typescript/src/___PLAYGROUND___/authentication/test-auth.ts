@@ -1,19 +1,16 @@
-import { begin } from '../helpers';
+import { runScript, withPlayground } from '../helpers';
 
-export const testAuth = async () => {
-  const context = await begin();
+export const testAuth = () =>
+  withPlayground(async (context) => {
+    console.log('Testing authentication...');
 
-  console.log('Testing authentication...');
+    // Test auth by getting networks (requires valid auth)
+    try {
+      const networks = await context.client.network.getAll();
+      console.log('Authentication successful - got networks:', networks.length);
+    } catch (error) {
+      console.error('Authentication failed:', error);
+    }
+  });
 
-  // Test auth by getting networks (requires valid auth)
-  try {
-    const networks = await context.client.network.getAll();
-    console.log('Authentication successful - got networks:', networks.length);
-  } catch (error) {
-    console.error('Authentication failed:', error);
-  }
-
-  await context.end();
-};
-
-testAuth().then(() => console.log('test-auth done'));
+runScript('test-auth', testAuth);
@@ -1,34 +1,30 @@
-import { begin, getAnvilAccounts } from '../helpers';
+import { runScript, withPlayground } from '../helpers';
 import { ethers } from 'ethers';
 
 // run with:
 // npm run playground::ethers::send-transaction
-export const sendTransaction = async () => {
-  const context = await begin();
-  const accounts = getAnvilAccounts();
+export const sendTransaction = () =>
+  withPlayground(async (context) => {
+    console.log('Sending transaction...');
 
-  console.log('Sending transaction...');
+    const provider = new ethers.BrowserProvider(
+      context.relayer.ethereumProvider()
+    );
+    const signer = await provider.getSigner();
 
-  const provider = new ethers.BrowserProvider(
-    context.relayer.ethereumProvider()
-  );
-  const signer = await provider.getSigner();
+    console.log('Sending to:', context.accounts[1].address);
+    console.log('From address:', await signer.getAddress());
 
-  console.log('Sending to:', accounts[1].address);
-  console.log('From address:', await signer.getAddress());
+    const tx = await signer.sendTransaction({
+      to: context.accounts[1].address,
+      value: ethers.parseEther('0.001'),
+    });
 
-  const tx = await signer.sendTransaction({
-    to: accounts[1].address,
-    value: ethers.parseEther('0.001'),
-  });
-
-  console.log('Transaction hash:', tx.hash);
-  console.log('Waiting for transaction receipt...');
+    console.log('Transaction hash:', tx.hash);
+    console.log('Waiting for transaction receipt...');
 
-  const receipt = await tx.wait();
-  console.log('Transaction receipt:', receipt);
-
-  await context.end();
-};
+    const receipt = await tx.wait();
+    console.log('Transaction receipt:', receipt);
+  });
 
-sendTransaction().then(() => console.log('send-transaction done'));
+runScript('send-transaction', sendTransaction);
@@ -1,88 +1,246 @@
 import { createClient, Client } from '../clients';
 import { AdminRelayerClient } from '../clients/admin';
 import { spawn, ChildProcess } from 'child_process';
-import { exec } from 'child_process';
+import { execFile } from 'child_process';
+import { open, readFile, rm, writeFile } from 'fs/promises';
+import { connect } from 'net';
+import { tmpdir } from 'os';
+import { join, resolve as resolvePath } from 'path';
 import { promisify } from 'util';
-import { Address } from 'viem';
-
-const execAsync = promisify(exec);
+import {
+  Address,
+  createWalletClient,
+  Hex,
+  http,
+  parseEther,
+  publicActions,
+} from 'viem';
+import { privateKeyToAccount } from 'viem/accounts';
+import { anvil } from 'viem/chains';
+
+const execFileAsync = promisify(execFile);
 
 // Configuration - set these environment variables or update directly
 const config = {
   serverUrl: process.env.SERVER_URL || 'http://localhost:8000',
   providerUrl: process.env.PROVIDER_URL || 'http://localhost:8545',
   chainId: parseInt(process.env.CHAIN_ID || '31337'),
+  databaseHost: process.env.DATABASE_HOST || '127.0.0.1',
+  databasePort: parseInt(process.env.DATABASE_PORT || '5471'),
+  // Leave the stack running after the script exits so the next script can
+  // reuse it, `npm run playground::stop` tears it down
+  keepAlive: process.env.RRELAYER_KEEP_ALIVE === '1',
+};
+
+// Records what a keep alive run started so a later run (or the stop script)
+// knows what it has to tear down
+const KEEP_ALIVE_PID_FILE = join(tmpdir(), 'rrelayer-playground.pid');
+
+/**
+ * Open the log file a kept alive process writes to, it can not use a pipe as
+ * that breaks once the script that spawned it exits
+ */
+const openKeepAliveLog = (name: string) => {
+  return open(join(tmpdir(), `rrelayer-playground-${name}.log`), 'a');
+};
+
+/**
+ * Build a name that will not clash with one made earlier, the nanosecond
+ * monotonic clock keeps names apart even when several are made in the same
+ * millisecond
+ */
+export const uniqueName = (prefix: string): string => {
+  return `${prefix}-${process.hrtime.bigint()}`;
 };
 
+// How long a single readiness probe may take before it counts as a failure
+const PROBE_TIMEOUT_MS = 1000;
+
+/**
+ * Probe an HTTP endpoint in-process, fetch only hands a connection back to its
+ * pool for the next probe once the response body is read or cancelled
+ * @returns the response if it answered with a 2xx status, otherwise null
+ */
+const probeHttp = async (
+  url: string,
+  init: RequestInit = {}
+): Promise<Response | null> => {
+  try {
+    const response = await fetch(url, {
+      ...init,
+      signal: AbortSignal.timeout(PROBE_TIMEOUT_MS),
+    });
+    if (!response.ok) {
+      await response.body?.cancel();
+      return null;
+    }
+
+    return response;
+  } catch {
+    return null;
+  }
+};
+
+// One client per process, every begin() context talks to the same server
+let basicAuthClient: Client | undefined;
+
 export const createBasicAuthClient = (): Client => {
-  return createClient({
-    serverUrl: 'http://localhost:8000',
-    auth: {
-      username: 'your_username',
-      password: 'your_password',
-    },
-  });
+  if (!basicAuthClient) {
+    basicAuthClient = createClient({
+      serverUrl: config.serverUrl,
+      auth: {
+        username: 'your_username',
+        password: 'your_password',
+      },
+    });
+  }
+
+  return basicAuthClient;
+};
+
+// Readiness polling starts fast and backs off so quick services are picked up
+// almost immediately without hammering slow ones
+const INITIAL_POLL_DELAY_MS = 20;
+const MAX_POLL_DELAY_MS = 1000;
+const POLL_BACKOFF_FACTOR = 1.7;
+
+/**
+ * Poll a probe with exponential backoff until it succeeds or the deadline hits
+ * @param probe - Returns true once the service is ready
+ * @param name - Human readable service name used in logs and errors
+ * @param timeoutMs - Total time to wait before giving up
+ * @param signal - Stops polling, so an abandoned wait does not keep the
+ * process alive until its deadline
+ */
+const waitUntilReady = async (
+  probe: () => Promise<boolean>,
+  name: string,
+  timeoutMs: number,
+  quiet: boolean,
+  signal?: AbortSignal
+): Promise<void> => {
+  const deadline = Date.now() + timeoutMs;
+  let delayMs = INITIAL_POLL_DELAY_MS;
+
+  while (true) {
+    if (signal?.aborted) {
+      throw new Error(`Stopped waiting for ${name}`);
+    }
+
+    if (await probe()) {
+      if (!quiet) console.log(`✅ ${name} is ready`);
+      return;
+    }
+
+    if (Date.now() + delayMs > deadline) {
+      throw new Error(`${name} failed to start within the expected time`);
+    }
+
+    if (!quiet) console.log(`⏳ Waiting for ${name}...`);
+    await new Promise((resolve) => setTimeout(resolve, delayMs));
+    delayMs = Math.min(delayMs * POLL_BACKOFF_FACTOR, MAX_POLL_DELAY_MS);
+  }
 };
 
-// export const createBasicAuthClient2 = async (): Client => {
-//   let blah = createClient({
-//     serverUrl: 'http://localhost:8000',
-//     auth: {
-//       username: 'your_username',
-//       password: 'your_password',
-//     },
-//   });
-//
-//   const relayer = await blah.getRelayerClient('94afb207-bb47-4392-9229-ba87e4d783cb');
-//   blah.getViemHttp()
-// };
-
-// export const blah = async () => {
-//  let relayer = createRelayerClient(
-//      {
-//        serverUrl: 'http://localhost:8000',
-//        relayerId: '94afb207-bb47-4392-9229-ba87e4d783cb',
-//        apiKey: 'YOUR_API_KEY',
-//      }
-//  );
-// }
+// The last line make start-anvil prints. anvil binds its port well before
+// that, but the target keeps seeding transactions from the first anvil account
+// with fixed nonces, and relayer funding sends from that same account
+const ANVIL_READY_PATTERN = /Anvil ready with realistic gas price history!/;
+// the seeding sends 100+ transactions one by one after anvil is up
+const ANVIL_START_TIMEOUT_MS = 120000;
+
+// Logged by rrelayer (crates/core/src/startup.rs) the moment it binds its
+// port, so a spawned server is ready before any HTTP probe answers
+const SERVER_READY_PATTERN = /rrelayer is up on http:\/\/\S+/;
+
+/**
+ * Rejects as soon as a process fails to spawn or exits with an error, so a
+ * start that is only probed for readiness does not sit out the whole timeout
+ */
+const failedStart = (child: ChildProcess, name: string): Promise<never> => {
+  return new Promise((_, reject) => {
+    child.once('error', reject);
+    child.once('exit', (code) => {
+      if (code !== 0) reject(new Error(`${name} exited with code ${code}`));
+    });
+  });
+};
 
 /**
  * Start Anvil using the make command
  * @returns Promise that resolves when Anvil is started
  */
 export const anvilStart = async (
-  quiet: boolean = false
+  quiet: boolean = false,
+  keepAlive: boolean = false
 ): Promise<ChildProcess> => {
   if (!quiet) console.log('🔨 Starting Anvil...');
 
   try {
+    const log = keepAlive ? await openKeepAliveLog('anvil') : null;
+
     // Use make command to start anvil in the playground/local-node directory
     const anvilProcess = spawn('make', ['start-anvil'], {
-      stdio: 'pipe',
+      stdio: log ? ['ignore', log.fd, log.fd] : ['ignore', 'pipe', 'pipe'],
       detached: true,
       cwd: '../../playground/local-node', // Navigate to root playground/local-node
     });
 
+    // A kept alive anvil outlives this script and logs to a file, make exits
+    // once the target has finished seeding so that exit is the ready signal.
+    // It is only unref'd afterwards, otherwise node would not wait for it
+    if (log) {
+      await log.close();
+      await new Promise<void>((resolve, reject) => {
+        const timeout = setTimeout(() => {
+          reject(new Error('Anvil start timeout'));
+        }, ANVIL_START_TIMEOUT_MS);
+
+        anvilProcess.once('error', (error) => {
+          clearTimeout(timeout);
+          reject(error);
+        });
+        anvilProcess.once('exit', (code) => {
+          clearTimeout(timeout);
+          if (code === 0) {
+            resolve();
+          } else {
+            reject(new Error(`Anvil exited with code ${code}`));
+          }
+        });
+      });
+      anvilProcess.unref();
+
+      if (!quiet) console.log('✅ Anvil started successfully');
+      return anvilProcess;
+    }
+
     return new Promise((resolve, reject) => {
       let output = '';
       let isStarted = false;
 
+      const timeout = setTimeout(() => {
+        reject(new Error('Anvil start timeout'));
+      }, ANVIL_START_TIMEOUT_MS);
+
       anvilProcess.stdout?.on('data', (data) => {
+        // Once started the output is only drained so anvil never blocks on a
+        // full pipe, nothing is kept around
+        if (isStarted) return;
+
         output += data.toString();
 
         // Only show logs until Anvil is started
-        if (!isStarted && !quiet) {
+        if (!quiet) {
           console.log('Anvil output:', data.toString());
         }
 
-        // Check if Anvil is ready (look for listening message)
-        if (
-          output.includes('Listening on') ||
-          output.includes('127.0.0.1:8545')
-        ) {
+        // Check if Anvil is ready (make has finished seeding it)
+        if (ANVIL_READY_PATTERN.test(output)) {
           if (!quiet) console.log('✅ Anvil started successfully');
           isStarted = true;
+          output = '';
+          clearTimeout(timeout);
           resolve(anvilProcess);
         }
       });
@@ -96,19 +254,16 @@ export const anvilStart = async (
 
       anvilProcess.on('error', (error) => {
         console.error('Failed to start Anvil:', error);
+        clearTimeout(timeout);
         reject(error);
       });
 
       anvilProcess.on('close', (code) => {
         if (code !== 0) {
+          clearTimeout(timeout);
           reject(new Error(`Anvil exited with code ${code}`));
         }
       });
-
-      // Timeout after 30 seconds
-      setTimeout(() => {
-        reject(new Error('Anvil start timeout'));
-      }, 30000);
     });
   } catch (error) {
     console.error('Error starting Anvil:', error);
@@ -116,22 +271,54 @@ export const anvilStart = async (
   }
 };
 
+let serverBinary: Promise<string> | null = null;
+
+/**
+ * Path of the CLI binary that runs the server, RRELAYER_BIN points at a
+ * prebuilt one, otherwise the CLI is built once per process so starting the
+ * server does not go through `cargo run` every time
+ */
+const resolveServerBinary = (quiet: boolean): Promise<string> => {
+  if (process.env.RRELAYER_BIN) {
+    return Promise.resolve(resolvePath(process.env.RRELAYER_BIN));
+  }
+
+  if (!serverBinary) {
+    if (!quiet) console.log('🔧 Building RRelayer CLI...');
+    serverBinary = execFileAsync('cargo', ['build', '-p', 'rrelayer_cli'], {
+      cwd: '../../crates/cli',
+    }).then(
+      () => resolvePath('../../target/debug/rrelayer_cli'),
+      (error) => {
+        serverBinary = null;
+        throw error;
+      }
+    );
+  }
+
+  return serverBinary;
+};
+
 /**
  * Start the local RRelayer server using the CLI command
  * @returns Promise that resolves when the server is started
  */
 export const startLocalNode = async (
-  quiet: boolean = false
+  quiet: boolean = false,
+  keepAlive: boolean = false
 ): Promise<ChildProcess> => {
   if (!quiet) console.log('🚀 Starting local RRelayer server...');
 
   try {
+    const binary = await resolveServerBinary(quiet);
+    const log = keepAlive ? await openKeepAliveLog('server') : null;
+
     // Run the CLI command to start the local server
     const serverProcess = spawn(
-      'cargo',
-      ['run', '--', 'start', '--path', '../../playground/local-node'],
+      binary,
+      ['start', '--path', '../../playground/local-node'],
       {
-        stdio: 'pipe',
+        stdio: log ? ['ignore', log.fd, log.fd] : ['ignore', 'pipe', 'pipe'],
         detached: true,
         cwd: '../../crates/cli', // Navigate to cli directory
         env: {
@@ -141,56 +328,71 @@ export const startLocalNode = async (
       }
     );
 
+    if (log) {
+      await log.close();
+      serverProcess.unref();
+
+      // stop polling once the start has failed, the poll would otherwise
+      // hold the script open for the rest of the timeout
+      const polling = new AbortController();
+      try {
+        await Promise.race([
+          waitForServer(60000, quiet, polling.signal),
+          failedStart(serverProcess, 'Server'),
+        ]);
+      } finally {
+        polling.abort();
+      }
+      return serverProcess;
+    }
+
     return new Promise((resolve, reject) => {
       let output = '';
+      let isStarted = false;
+
+      // Timeout after 60 seconds (server might take longer to start)
+      const timeout = setTimeout(() => {
+        reject(new Error('Local server start timeout'));
+      }, 60000);
+
+      // the server's log lines can land on either stream, so watch both
+      const onOutput = (data: Buffer) => {
+        if (isStarted) return;
 
-      serverProcess.stdout?.on('data', (data) => {
         output += data.toString();
-        if (!quiet) console.log('Server output:', data.toString());
 
-        // Check if server is ready (look for server start message)
-        if (
-          output.includes('Server running') ||
-          output.includes('listening') ||
-          output.includes('8000')
-        ) {
+        if (SERVER_READY_PATTERN.test(output)) {
           if (!quiet)
             console.log('✅ Local RRelayer server started successfully');
+          isStarted = true;
+          output = '';
+          clearTimeout(timeout);
           resolve(serverProcess);
         }
+      };
+
+      serverProcess.stdout?.on('data', (data) => {
+        if (!quiet) console.log('Server output:', data.toString());
+        onOutput(data);
       });
 
       serverProcess.stderr?.on('data', (data) => {
-        const errorMsg = data.toString();
-        if (!quiet) console.error('Server error:', errorMsg);
-
-        // Some server messages might come through stderr but aren't errors
-        if (
-          errorMsg.includes('Server running') ||
-          errorMsg.includes('listening') ||
-          errorMsg.includes('8000')
-        ) {
-          if (!quiet)
-            console.log('✅ Local RRelayer server started successfully');
-          resolve(serverProcess);
-        }
+        if (!quiet) console.error('Server error:', data.toString());
+        onOutput(data);
       });
 
       serverProcess.on('error', (error) => {
         console.error('Failed to start local server:', error);
+        clearTimeout(timeout);
         reject(error);
       });
 
       serverProcess.on('close', (code) => {
         if (code !== 0) {
+          clearTimeout(timeout);
           reject(new Error(`Server exited with code ${code}`));
         }
       });
-
-      // Timeout after 60 seconds (server might take longer to start)
-      setTimeout(() => {
-        reject(new Error('Local server start timeout'));
-      }, 60000);
     });
   } catch (error) {
     console.error('Error starting local server:', error);
@@ -203,58 +405,66 @@ export const startLocalNode = async (
  * @returns Promise<boolean> - true if server is running
  */
 export const isServerRunning = async (): Promise<boolean> => {
-  try {
-    const { stdout } = await execAsync(
-      'curl -s http://localhost:8000/health || echo "failed"'
-    );
-    return !stdout.includes('failed') && !stdout.includes('Connection refused');
-  } catch {
-    return false;
-  }
+  const response = await probeHttp(`${config.serverUrl}/health`);
+  // only the status matters, drop the body so the connection is reused
+  await response?.body?.cancel();
+  return response !== null;
 };
 
 /**
  * Wait for RRelayer server to be ready
- * @param maxAttempts - Maximum number of attempts to check (default: 60)
- * @param delayMs - Delay between checks in milliseconds (default: 1000)
+ * @param timeoutMs - Total time to wait in milliseconds (default: 60000)
+ * @param signal - Stops waiting early
  */
-export const waitForServer = async (
-  maxAttempts: number = 60,
-  delayMs: number = 1000,
-  quiet: boolean = false
+export const waitForServer = (
+  timeoutMs: number = 60000,
+  quiet: boolean = false,
+  signal?: AbortSignal
 ): Promise<void> => {
-  for (let i = 0; i < maxAttempts; i++) {
-    if (await isServerRunning()) {
-      if (!quiet) console.log('✅ RRelayer server is ready');
-      return;
-    }
-
-    if (!quiet)
-      console.log(
-        `⏳ Waiting for RRelayer server... (${i + 1}/${maxAttempts})`
-      );
-    await new Promise((resolve) => setTimeout(resolve, delayMs));
-  }
-
-  throw new Error('RRelayer server failed to start within the expected time');
+  return waitUntilReady(
+    isServerRunning,
+    'RRelayer server',
+    timeoutMs,
+    quiet,
+    signal
+  );
 };
 
 /**
  * Stop server process
  * @param serverProcess - The server process to stop
  */
-export const stopServer = (
+export const stopServer = async (
   serverProcess: ChildProcess,
   quiet: boolean = false
-): void => {
+): Promise<void> => {
   if (!quiet) console.log('🛑 Stopping RRelayer server...');
 
   if (serverProcess) {
-    serverProcess.kill('SIGTERM');
+    if (serverProcess.exitCode === null && serverProcess.signalCode === null) {
+      const exited = new Promise((resolve) =>
+        serverProcess.once('exit', resolve)
+      );
+      serverProcess.kill('SIGTERM');
+      await exited;
+    }
     if (!quiet) console.log('✅ RRelayer server stopped');
   }
 };
 
+// Anvil's first default account signs funding transactions in-process and ships
+// them with eth_sendRawTransaction, reusing one keep-alive RPC connection
+const anvilFunder = createWalletClient({
+  account: privateKeyToAccount(
+    '0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80'
+  ),
+  chain: anvil,
+  transport: http(config.providerUrl),
+}).extend(publicActions);
+
+// Anvil mines within its block time, so poll for receipts tightly
+const RECEIPT_POLLING_INTERVAL_MS = 10;
+
 /**
  * Send a transaction with gas using Anvil
  * @param to - Recipient address
@@ -271,34 +481,19 @@ export const sendTxWithGas = async (
   gasLimit: string = '21000',
   data: string = '0x',
   quiet: boolean = false
-): Promise<string> => {
+): Promise<Hex> => {
   if (!quiet)
     console.log(`💸 Sending transaction to ${to} with value ${value} wei`);
 
   try {
-    // Build the cast send command - different syntax for transfers vs contract calls
-    let command;
-    if (data === '0x' || !data) {
-      // Simple transfer - no data needed
-      command = `FOUNDRY_DISABLE_NIGHTLY_WARNING=1 cast send ${to} --value ${value} --gas-price ${gasPrice} --gas-limit ${gasLimit} --rpc-url http://127.0.0.1:8545 --private-key 0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80`;
-    } else {
-      // Contract call - include data
-      command = `FOUNDRY_DISABLE_NIGHTLY_WARNING=1 cast send ${to} "${data}" --value ${value} --gas-price ${gasPrice} --gas-limit ${gasLimit} --rpc-url http://127.0.0.1:8545 --private-key 0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80`;
-    }
-
-    const { stdout, stderr } = await execAsync(command);
-
-    // Only treat stderr as error if it contains actual error messages, not warnings
-    if (
-      stderr &&
-      !stderr.includes('Warning:') &&
-      !stderr.includes('This is a nightly build')
-    ) {
-      if (!quiet) console.error('Transaction error:', stderr);
-      throw new Error(stderr);
-    }
+    const txHash = await anvilFunder.sendTransaction({
+      to: to as Address,
+      value: BigInt(value),
+      gasPrice: BigInt(gasPrice),
+      gas: BigInt(gasLimit),
+      data: data ? (data as Hex) : undefined,
+    });
 
-    const txHash = stdout.trim();
     if (!quiet) console.log(`✅ Transaction sent: ${txHash}`);
     return txHash;
   } catch (error) {
@@ -307,6 +502,45 @@ export const sendTxWithGas = async (
   }
 };
 
+/**
+ * Fund an address from Anvil's first default account
+ * @param address - The address to fund
+ * @param fundingAmount - Amount to fund in ETH
+ * @returns The funding transaction hash, once it has been mined
+ */
+export const fundRelayer = async (
+  address: string,
+  fundingAmount: string,
+  quiet: boolean = false
+): Promise<Hex> => {
+  if (!quiet) console.log(`💰 Funding relayer with ${fundingAmount} ETH...`);
+
+  // exact decimal to wei conversion, going through a float turns large amounts
+  // into exponent notation (1000 * 1e18 is "1e+21", which BigInt rejects) and
+  // fractional amounts lose precision (1.1 * 1e18 is 1100000000000000100)
+  const fundingAmountWei = parseEther(fundingAmount).toString();
+
+  const fundingTxHash = await sendTxWithGas(
+    address,
+    fundingAmountWei,
+    '1000000000', // 1 gwei gas price
+    '21000', // standard transfer gas limit
+    '0x',
+    quiet
+  );
+
+  if (!quiet)
+    console.log(`✅ Relayer funded with transaction: ${fundingTxHash}`);
+
+  // Wait for the funding to be mined so the relayer can spend it straight away
+  await anvilFunder.waitForTransactionReceipt({
+    hash: fundingTxHash,
+    pollingInterval: RECEIPT_POLLING_INTERVAL_MS,
+  });
+
+  return fundingTxHash;
+};
+
 /**
  * Create a relayer and fund it using Anvil
  * @param client - The RRelayer client
@@ -327,7 +561,7 @@ export const createRelayerAndFund = async (
 }> => {
   try {
     // Generate relayer name if not provided
-    const relayerName = name || `funded-relayer-${Date.now()}`;
+    const relayerName = name || uniqueName('funded-relayer');
 
     if (!quiet) console.log(`🔧 Creating relayer: ${relayerName}`);
 
@@ -339,25 +573,12 @@ export const createRelayerAndFund = async (
       );
 
     // Fund the relayer using Anvil
-    if (!quiet) console.log(`💰 Funding relayer with ${fundingAmount} ETH...`);
-
-    const fundingAmountWei = (parseFloat(fundingAmount) * 1e18).toString();
-
-    const fundingTxHash = await sendTxWithGas(
+    const fundingTxHash = await fundRelayer(
       relayer.address,
-      fundingAmountWei,
-      '1000000000', // 1 gwei gas price
-      '21000', // standard transfer gas limit
-      '0x',
+      fundingAmount,
       quiet
     );
 
-    if (!quiet)
-      console.log(`✅ Relayer funded with transaction: ${fundingTxHash}`);
-
-    // Wait a bit for the transaction to be mined
-    await new Promise((resolve) => setTimeout(resolve, 2000));
-
     return {
       relayer,
       fundingTxHash,
@@ -372,45 +593,58 @@ export const createRelayerAndFund = async (
  * Stop Anvil process
  * @param anvilProcess - The Anvil process to stop
  */
-export const anvilStop = (
+export const anvilStop = async (
   anvilProcess: ChildProcess,
   quiet: boolean = false
-): void => {
+): Promise<void> => {
   if (!quiet) console.log('🛑 Stopping Anvil...');
 
   if (anvilProcess) {
     anvilProcess.kill('SIGTERM');
+    // make backgrounds anvil itself, the stop target kills it via its pid file
+    await runToCompletion(
+      'make',
+      ['stop-anvil'],
+      '../../playground/local-node'
+    );
     if (!quiet) console.log('✅ Anvil stopped');
   }
 };
 
+export interface AnvilAccount {
+  readonly address: Address;
+  readonly privateKey: string;
+}
+
+const ANVIL_ACCOUNTS: readonly [AnvilAccount, AnvilAccount, AnvilAccount] = [
+  {
+    address: '0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266',
+    privateKey:
+      '0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80',
+  },
+  {
+    address: '0x70997970C51812dc3A010C7d01b50e0d17dc79C8',
+    privateKey:
+      '0x59c6995e998f97a5a0044966f0945389dc9e86dae88c7a8412f4603b6b78690d',
+  },
+  {
+    address: '0x3C44CdDdB6a900fa2b585dd299e03d12FA4293BC',
+    privateKey:
+      '0x5de4111afa1a4b94908f83103eb1f1706367c2e68ca870fc3fb9a804cdab365a',
+  },
+  // Add more accounts as needed
+];
+
 /**
  * Get the default Anvil accounts with their private keys
  * @returns Array of account objects with address and privateKey
  */
-export const getAnvilAccounts = (): [
-  { address: Address; privateKey: string },
-  { address: Address; privateKey: string },
-  { address: Address; privateKey: string },
+export const getAnvilAccounts = (): readonly [
+  AnvilAccount,
+  AnvilAccount,
+  AnvilAccount,
 ] => {
-  return [
-    {
-      address: '0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266',
-      privateKey:
-        '0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80',
-    },
-    {
-      address: '0x70997970C51812dc3A010C7d01b50e0d17dc79C8',
-      privateKey:
-        '0x59c6995e998f97a5a0044966f0945389dc9e86dae88c7a8412f4603b6b78690d',
-    },
-    {
-      address: '0x3C44CdDdB6a900fa2b585dd299e03d12FA4293BC',
-      privateKey:
-        '0x5de4111afa1a4b94908f83103eb1f1706367c2e68ca870fc3fb9a804cdab365a',
-    },
-    // Add more accounts as needed
-  ];
+  return ANVIL_ACCOUNTS;
 };
 
 /**
@@ -418,38 +652,369 @@ export const getAnvilAccounts = (): [
  * @returns Promise<boolean> - true if Anvil is running
  */
 export const isAnvilRunning = async (): Promise<boolean> => {
+  const response = await probeHttp(config.providerUrl, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({
+      jsonrpc: '2.0',
+      method: 'eth_blockNumber',
+      params: [],
+      id: 1,
+    }),
+  });
+  if (!response) return false;
+
   try {
-    const { stdout } = await execAsync(
-      'curl -s -X POST -H "Content-Type: application/json" --data \'{"jsonrpc":"2.0","method":"eth_blockNumber","params":[],"id":1}\' http://127.0.0.1:8545'
-    );
-    return stdout.includes('result');
+    const body = await response.json();
+    return 'result' in body;
   } catch {
     return false;
   }
 };
 
+/**
+ * Check if the playground Postgres container is accepting connections
+ * Sends a Postgres SSLRequest and waits for the single byte answer, so a docker
+ * port that is bound before Postgres is ready does not count as running
+ * @returns Promise<boolean> - true if Postgres is running
+ */
+export const isDatabaseContainerRunning = (): Promise<boolean> => {
+  return new Promise((resolve) => {
+    const socket = connect(config.databasePort, config.databaseHost);
+    const finish = (running: boolean) => {
+      socket.destroy();
+      resolve(running);
+    };
+
+    socket.setTimeout(PROBE_TIMEOUT_MS, () => finish(false));
+    socket.once('error', () => finish(false));
+    // a published docker port accepts and then closes the connection while
+    // postgres inside the container is not listening yet, and a socket that
+    // has ended never times out
+    socket.once('close', () => finish(false));
+    socket.once('connect', () => {
+      // length 8 + SSLRequest code 80877103
+      socket.write(Buffer.from([0, 0, 0, 8, 0x04, 0xd2, 0x16, 0x2f]));
+    });
+    socket.once('data', (data) => {
+      // postgres answers 'S' or 'N' depending on whether it supports SSL
+      finish(data[0] === 0x53 || data[0] === 0x4e);
+    });
+  });
+};
+
 /**
  * Wait for Anvil to be ready
- * @param maxAttempts - Maximum number of attempts to check (default: 30)
- * @param delayMs - Delay between checks in milliseconds (default: 1000)
+ * @param timeoutMs - Total time to wait in milliseconds (default: 30000)
  */
-export const waitForAnvil = async (
-  maxAttempts: number = 30,
-  delayMs: number = 1000,
+export const waitForAnvil = (
+  timeoutMs: number = 30000,
   quiet: boolean = false
 ): Promise<void> => {
-  for (let i = 0; i < maxAttempts; i++) {
-    if (await isAnvilRunning()) {
-      if (!quiet) console.log('✅ Anvil is ready');
-      return;
+  return waitUntilReady(isAnvilRunning, 'Anvil', timeoutMs, quiet);
+};
+
+/**
+ * Start the playground Postgres container using docker compose
+ * @returns Promise that resolves once the container reports healthy
+ */
+export const startDatabaseContainer = async (
+  quiet: boolean = false
+): Promise<void> => {
+  if (!quiet) console.log('🐘 Starting Postgres container...');
+
+  try {
+    // --wait only returns once the postgres healthcheck passes
+    await execFileAsync(
+      'docker',
+      ['compose', 'up', '-d', '--wait', '--wait-timeout', '60'],
+      { cwd: '../../playground/local-node' }
+    );
+    if (!quiet) console.log('✅ Postgres container started');
+  } catch (error) {
+    console.error('Failed to start Postgres container:', error);
+    throw error;
+  }
+};
+
+/**
+ * Run a command to completion without capturing its output
+ * @returns The exit code, or null if the command could not be run
+ */
+const runToCompletion = (
+  command: string,
+  args: string[],
+  cwd: string
+): Promise<number | null> => {
+  return new Promise((resolve) => {
+    spawn(command, args, { stdio: 'ignore', cwd })
+      .on('error', () => resolve(null))
+      .on('close', resolve);
+  });
+};
+
+/**
+ * Stop the playground Postgres container
+ */
+export const stopDatabaseContainer = async (
+  quiet: boolean = false
+): Promise<void> => {
+  if (!quiet) console.log('🛑 Stopping Postgres container...');
+
+  const code = await runToCompletion(
+    'docker',
+    ['compose', 'down'],
+    '../../playground/local-node'
+  );
+
+  if (code === 0) {
+    if (!quiet) console.log('✅ Postgres container stopped');
+  } else if (!quiet) {
+    console.warn(`⚠️ Could not stop Postgres container (exit code ${code})`);
+  }
+};
+
+/**
+ * Wait for the playground Postgres container to accept connections
+ * @param timeoutMs - Total time to wait in milliseconds (default: 30000)
+ */
+export const waitForDatabaseContainer = (
+  timeoutMs: number = 30000,
+  quiet: boolean = false
+): Promise<void> => {
+  return waitUntilReady(
+    isDatabaseContainerRunning,
+    'Postgres',
+    timeoutMs,
+    quiet
+  );
+};
+
+/**
+ * The parts of the local stack (Postgres, Anvil, RRelayer server) this process
+ * started itself and therefore has to tear down again
+ */
+interface PlaygroundStack {
+  anvilProcess: ChildProcess | null;
+  serverProcess: ChildProcess | null;
+  databaseStarted: boolean;
+}
+
+/**
+ * Stop whatever part of the local stack this process started
+ */
+const stopStack = async (
+  stack: PlaygroundStack,
+  quiet: boolean
+): Promise<void> => {
+  // the services are torn down independently, so shutdown only takes as long
+  // as the slowest of them
+  const stops: Promise<void>[] = [];
+
+  if (stack.serverProcess) {
+    stops.push(stopServer(stack.serverProcess, quiet));
+  }
+
+  if (stack.anvilProcess) {
+    stops.push(anvilStop(stack.anvilProcess, quiet));
+  }
+
+  if (stack.databaseStarted) {
+    stops.push(stopDatabaseContainer(quiet));
+  }
+
+  await Promise.all(stops);
+};
+
+/**
+ * What keep alive runs started, persisted in KEEP_ALIVE_PID_FILE
+ */
+interface KeptAliveStack {
+  serverPid: number | null;
+  anvilStarted: boolean;
+  databaseStarted: boolean;
+}
+
+const readKeptAliveStack = async (): Promise<KeptAliveStack | null> => {
+  try {
+    return JSON.parse(await readFile(KEEP_ALIVE_PID_FILE, 'utf8'));
+  } catch {
+    return null;
+  }
+};
+
+/**
+ * Merge what this run started into the pid file, a previous keep alive run
+ * may already have started the rest of the stack
+ */
+const recordKeptAliveStack = async (stack: PlaygroundStack): Promise<void> => {
+  const kept = await readKeptAliveStack();
+  const record: KeptAliveStack = {
+    serverPid: stack.serverProcess?.pid ?? kept?.serverPid ?? null,
+    anvilStarted: !!stack.anvilProcess || !!kept?.anvilStarted,
+    databaseStarted: stack.databaseStarted || !!kept?.databaseStarted,
+  };
+
+  await writeFile(KEEP_ALIVE_PID_FILE, JSON.stringify(record));
+};
+
+/**
+ * Tear down a stack that RRELAYER_KEEP_ALIVE runs left running
+ */
+export const stopKeptAliveStack = async (
+  quiet: boolean = false
+): Promise<void> => {
+  const kept = await readKeptAliveStack();
+  if (!kept) {
+    if (!quiet) console.log('No kept alive playground stack found');
+    return;
+  }
+
+  if (kept.serverPid) {
+    if (!quiet) console.log('🛑 Stopping RRelayer server...');
+    try {
+      // the server was spawned detached, so this signals its process group
+      process.kill(-kept.serverPid, 'SIGTERM');
+    } catch {
+      // already gone
     }
+  }
 
-    if (!quiet)
-      console.log(`⏳ Waiting for Anvil... (${i + 1}/${maxAttempts})`);
-    await new Promise((resolve) => setTimeout(resolve, delayMs));
+  if (kept.anvilStarted) {
+    if (!quiet) console.log('🛑 Stopping Anvil...');
+    await runToCompletion(
+      'make',
+      ['stop-anvil'],
+      '../../playground/local-node'
+    );
+  }
+
+  if (kept.databaseStarted) {
+    await stopDatabaseContainer(quiet);
   }
 
-  throw new Error('Anvil failed to start within the expected time');
+  await rm(KEEP_ALIVE_PID_FILE, { force: true });
+  if (!quiet) console.log('✅ Playground stack stopped');
+};
+
+/**
+ * Bring up whatever part of the local stack is not already running, a stack
+ * left running by a keep alive run is picked up as is. A server running
+ * without anvil is refused, starting anvil would wipe its database
+ */
+const bootStack = async (quiet: boolean): Promise<PlaygroundStack> => {
+  const stack: PlaygroundStack = {
+    anvilProcess: null,
+    serverProcess: null,
+    databaseStarted: false,
+  };
+
+  try {
+    // probe everything at once, when the stack is already up (the usual case
+    // while iterating on scripts) this is the only thing boot does
+    const [databaseRunning, anvilRunning, serverRunning] = await Promise.all([
+      isDatabaseContainerRunning(),
+      isAnvilRunning(),
+      isServerRunning(),
+    ]);
+
+    // anvil's start target drops every schema, including the ones a live
+    // server is using, and a server this process did not start can not be
+    // restarted from here
+    if (serverRunning && !anvilRunning) {
+      throw new Error(
+        `The rrelayer server at ${config.serverUrl} is running without anvil, starting anvil would reset its database. Stop the server (npm run playground::stop for a kept alive one) and run again`
+      );
+    }
+
+    // anvil's start target resets the database schemas and the server migrates
+    // on boot, so Postgres has to accept connections before either is spawned
+    if (!databaseRunning) {
+      await startDatabaseContainer(quiet);
+      stack.databaseStarted = true;
+    }
+
+    // anvil's start target drops the schemas the server creates on boot and
+    // the server checks anvil's chain id while loading providers, so anvil
+    // has to be up before the server is spawned - both starts resolve once
+    // the process reports it is ready. A server is only ever spawned after a
+    // fresh anvil here, the check above rules out the reverse
+    if (!anvilRunning) {
+      stack.anvilProcess = await anvilStart(quiet, config.keepAlive);
+    }
+
+    if (!serverRunning) {
+      stack.serverProcess = await startLocalNode(quiet, config.keepAlive);
+    }
+
+    if (config.keepAlive) {
+      await recordKeptAliveStack(stack);
+    }
+
+    return stack;
+  } catch (error) {
+    // Cleanup on error
+    await stopStack(stack, quiet);
+    throw error;
+  }
+};
+
+// The stack is booted by the first begin() in a process and stays up for every
+// later one, sequential or overlapping, until shutdownPlayground tears it down
+let playgroundStack: Promise<PlaygroundStack> | null = null;
+let playgroundShutdown: Promise<void> | null = null;
+
+const acquireStack = async (quiet: boolean): Promise<PlaygroundStack> => {
+  // never boot a new stack while the previous one is still being torn down
+  if (playgroundShutdown) await playgroundShutdown;
+
+  if (!playgroundStack) {
+    playgroundStack = bootStack(quiet);
+  }
+
+  const booting = playgroundStack;
+  try {
+    return await booting;
+  } catch (error) {
+    // bootStack already cleaned up what it started, let the next call retry
+    if (playgroundStack === booting) playgroundStack = null;
+    throw error;
+  }
+};
+
+/**
+ * Tear down the stack begin() booted in this process, a kept alive stack is
+ * left running. runScript calls this once the script has finished
+ */
+export const shutdownPlayground = async (
+  quiet: boolean = true
+): Promise<void> => {
+  // take the stack synchronously so a begin() racing this sees no stack and
+  // waits for the shutdown instead of reusing one that is being torn down
+  const booting = playgroundStack;
+  playgroundStack = null;
+  if (!booting) return;
+
+  const shutdown = (async () => {
+    let stack: PlaygroundStack;
+    try {
+      stack = await booting;
+    } catch {
+      // a failed boot has nothing left running
+      return;
+    }
+
+    if (!config.keepAlive) {
+      await stopStack(stack, quiet);
+    }
+  })();
+
+  playgroundShutdown = shutdown;
+  try {
+    await shutdown;
+  } finally {
+    if (playgroundShutdown === shutdown) playgroundShutdown = null;
+  }
 };
 
 export interface BeginResult {
@@ -467,70 +1032,87 @@ export const begin = async (
 ): Promise<BeginResult> => {
   if (!quiet) console.log('🚀 Setting up RRelayer playground...\n');
 
-  let anvilProcess: ChildProcess | null = null;
-  let serverProcess: ChildProcess | null = null;
+  // the stack stays up for the rest of the process, shutdownPlayground
+  // stops it
+  await acquireStack(quiet);
 
-  try {
-    // const anvilRunning = await isAnvilRunning();
-    // if (!anvilRunning) {
-    //   if (!quiet) console.log('🔨 Starting Anvil...');
-    //   anvilProcess = await anvilStart(quiet);
-    //   await waitForAnvil(30, 1000, quiet);
-    // }
-    //
-    // const serverRunning = await isServerRunning();
-    // if (!serverRunning) {
-    //   if (!quiet) console.log('🚀 Starting RRelayer server...');
-    //   serverProcess = await startLocalNode(quiet);
-    //   await waitForServer(60, 1000, quiet);
-    // }
-
-    const client = createBasicAuthClient();
-
-    const { relayer: relayerInfo } = await createRelayerAndFund(
-      client,
-      config.chainId,
-      relayerName || `begin-relayer-${Date.now()}`,
-      fundingAmount,
-      quiet
-    );
+  const client = createBasicAuthClient();
 
-    const relayer = await client.getRelayerClient(relayerInfo.id);
+  const relayerInfo = await client.relayer.create(
+    config.chainId,
+    relayerName || uniqueName('begin-relayer')
+  );
 
-    const accounts = getAnvilAccounts();
+  // setting up the relayer client does not need the funds, so it overlaps
+  // with waiting for the funding to be mined
+  const [relayer] = await Promise.all([
+    client.getRelayerClient(relayerInfo.id),
+    fundRelayer(relayerInfo.address, fundingAmount, quiet),
+  ]);
 
-    if (!quiet)
-      console.log(
-        `✅ Ready! Relayer ${relayerInfo.id} at ${relayerInfo.address}\n`
-      );
+  const accounts = getAnvilAccounts();
 
-    const end = async () => {
-      try {
-        await client.relayer.delete(relayerInfo.id);
-      } catch (error) {
-        if (!quiet) console.warn('⚠️ Could not delete relayer:', error);
-      }
+  if (!quiet)
+    console.log(
+      `✅ Ready! Relayer ${relayerInfo.id} at ${relayerInfo.address}\n`
+    );
 
-      if (serverProcess) {
-        stopServer(serverProcess, quiet);
-      }
+  const end = async () => {
+    try {
+      await client.relayer.delete(relayerInfo.id);
+    } catch (error) {
+      if (!quiet) console.warn('⚠️ Could not delete relayer:', error);
+    }
+  };
+
+  return {
+    relayer,
+    client,
+    relayerInfo,
+    accounts,
+    end,
+  };
+};
 
-      if (anvilProcess) {
-        anvilStop(anvilProcess, quiet);
-      }
-    };
+/**
+ * Run a playground script against a freshly funded relayer, the relayer is
+ * deleted however the script finishes, even if it throws or returns early
+ */
+export const withPlayground = async <T>(
+  run: (context: BeginResult) => Promise<T>,
+  fundingAmount?: string,
+  relayerName?: string,
+  quiet?: boolean
+): Promise<T> => {
+  const context = await begin(fundingAmount, relayerName, quiet);
 
-    return {
-      relayer,
-      client,
-      relayerInfo,
-      accounts,
-      end,
-    };
-  } catch (error) {
-    // Cleanup on error
-    if (serverProcess) stopServer(serverProcess, quiet);
-    if (anvilProcess) anvilStop(anvilProcess, quiet);
-    throw error;
+  try {
+    return await run(context);
+  } finally {
+    await context.end();
   }
 };
+
+/**
+ * Entrypoint for playground scripts, reports when the script is done, fails
+ * the process with a non zero exit code when it throws and then shuts down
+ * the stack the script booted
+ */
+export const runScript = (
+  name: string,
+  script: () => Promise<unknown>
+): void => {
+  script()
+    .then(
+      () => console.log(`${name} done`),
+      (error) => {
+        console.error(`${name} failed:`, error);
+        process.exitCode = 1;
+      }
+    )
+    .then(() => shutdownPlayground())
+    .catch((error) => {
+      console.error(`${name} could not stop the playground:`, error);
+      process.exitCode = 1;
+    });
+};
@@ -1,12 +1,9 @@
-import { begin } from '../helpers';
+import { runScript, withPlayground } from '../helpers';
 
-export const getAllNetworks = async () => {
-  let context = await begin();
+export const getAllNetworks = () =>
+  withPlayground(async (context) => {
+    let networks = await context.client.network.getAll();
+    console.log('networks', networks);
+  });
 
-  let networks = await context.client.network.getAll();
-  console.log('networks', networks);
-
-  await context.end();
-};
-
-getAllNetworks().then((_) => () => console.log('get-all-networks done'));
+runScript('get-all-networks', getAllNetworks);
@@ -1,13 +1,10 @@
-import { begin } from '../helpers';
+import { runScript, withPlayground } from '../helpers';
 
-export const getGasPrice = async () => {
-  const context = await begin();
+export const getGasPrice = () =>
+  withPlayground(async (context) => {
+    console.log('Getting gas price...');
+    const gasPrice = await context.client.network.getGasPrices(31337);
+    console.log('Gas price:', gasPrice);
+  });
 
-  console.log('Getting gas price...');
-  const gasPrice = await context.client.network.getGasPrices(31337);
-  console.log('Gas price:', gasPrice);
-
-  await context.end();
-};
-
-getGasPrice().then(() => console.log('get-gas-price done'));
+runScript('get-gas-price', getGasPrice);
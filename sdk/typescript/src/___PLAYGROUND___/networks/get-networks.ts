@@ -1,12 +1,9 @@
-import { begin } from '../helpers';
+import { runScript, withPlayground } from '../helpers';
 
-export const getNetwork = async () => {
-  let context = await begin();
+export const getNetwork = () =>
+  withPlayground(async (context) => {
+    let networks = await context.client.network.get(31337);
+    console.log('networks', networks);
+  });
 
-  let networks = await context.client.network.get(31337);
-  console.log('networks', networks);
-
-  await context.end();
-};
-
-getNetwork().then((_) => () => console.log('get-network done'));
+runScript('get-networks', getNetwork);
@@ -1,20 +1,17 @@
-import { begin } from '../helpers';
+import { runScript, uniqueName, withPlayground } from '../helpers';
 
-export const createRelayer = async () => {
-  const context = await begin();
+export const createRelayer = () =>
+  withPlayground(async (context) => {
+    console.log('Creating new relayer...');
+    const relayer = await context.client.relayer.create(
+      31337,
+      uniqueName('test-relayer')
+    );
+    console.log('Created relayer:', relayer);
 
-  console.log('Creating new relayer...');
-  const relayer = await context.client.relayer.create(
-    31337,
-    `test-relayer-${Date.now()}`
-  );
-  console.log('Created relayer:', relayer);
+    // Clean up - delete the test relayer
+    await context.client.relayer.delete(relayer.id);
+    console.log('Test relayer cleaned up');
+  });
 
-  // Clean up - delete the test relayer
-  await context.client.relayer.delete(relayer.id);
-  console.log('Test relayer cleaned up');
-
-  await context.end();
-};
-
-createRelayer().then(() => console.log('create-relayer done'));
+runScript('create-relayer', createRelayer);
@@ -1,13 +1,10 @@
-import { begin } from '../helpers';
+import { runScript, withPlayground } from '../helpers';
 
-export const getAddress = async () => {
-  const context = await begin();
+export const getAddress = () =>
+  withPlayground(async (context) => {
+    console.log('Getting relayer address...');
+    const address = await context.relayer.address();
+    console.log('Relayer address:', address);
+  });
 
-  console.log('Getting relayer address...');
-  const address = await context.relayer.address();
-  console.log('Relayer address:', address);
-
-  await context.end();
-};
-
-getAddress().then(() => console.log('get-address done'));
+runScript('get-address', getAddress);
@@ -1,13 +1,10 @@
-import { begin } from '../helpers';
+import { runScript, withPlayground } from '../helpers';
 
-export const getAllRelayers = async () => {
-  const context = await begin();
+export const getAllRelayers = () =>
+  withPlayground(async (context) => {
+    console.log('Getting all relayers...');
+    const relayers = await context.client.relayer.getAll();
+    console.log('All relayers:', relayers);
+  });
 
-  console.log('Getting all relayers...');
-  const relayers = await context.client.relayer.getAll();
-  console.log('All relayers:', relayers);
-
-  await context.end();
-};
-
-getAllRelayers().then(() => console.log('get-all-relayers done'));
+runScript('get-all-relayers', getAllRelayers);
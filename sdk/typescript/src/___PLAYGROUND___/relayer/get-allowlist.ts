@@ -1,13 +1,10 @@
-import { begin } from '../helpers';
+import { runScript, withPlayground } from '../helpers';
 
-export const getAllowlist = async () => {
-  const context = await begin();
+export const getAllowlist = () =>
+  withPlayground(async (context) => {
+    console.log('Getting relayer allowlist...');
+    const allowlists = await context.relayer.allowlist.get();
+    console.log('Relayer address:', allowlists);
+  });
 
-  console.log('Getting relayer allowlist...');
-  const allowlists = await context.relayer.allowlist.get();
-  console.log('Relayer address:', allowlists);
-
-  await context.end();
-};
-
-getAllowlist().then(() => console.log('get-allowlist done'));
+runScript('get-allowlist', getAllowlist);
@@ -1,13 +1,10 @@
-import { begin } from '../helpers';
+import { runScript, withPlayground } from '../helpers';
 
-export const getBalance = async () => {
-  const context = await begin();
+export const getBalance = () =>
+  withPlayground(async (context) => {
+    console.log('Getting relayer balance...');
+    const balance = await context.relayer.getBalanceOf();
+    console.log('Relayer balance:', balance, 'ETH');
+  });
 
-  console.log('Getting relayer balance...');
-  const balance = await context.relayer.getBalanceOf();
-  console.log('Relayer balance:', balance, 'ETH');
-
-  await context.end();
-};
-
-getBalance().then(() => console.log('get-balance done'));
+runScript('get-balance', getBalance);
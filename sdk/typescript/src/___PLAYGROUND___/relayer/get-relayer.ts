@@ -1,13 +1,12 @@
-import { begin } from '../helpers';
-
-export const getRelayer = async () => {
-  const context = await begin();
-
-  console.log('Getting relayer info...');
-  const relayerInfo = await context.client.relayer.get(context.relayerInfo.id);
-  console.log('Relayer info:', relayerInfo);
-
-  await context.end();
-};
-
-getRelayer().then(() => console.log('get-relayer done'));
+import { runScript, withPlayground } from '../helpers';
+
+export const getRelayer = () =>
+  withPlayground(async (context) => {
+    console.log('Getting relayer info...');
+    const relayerInfo = await context.client.relayer.get(
+      context.relayerInfo.id
+    );
+    console.log('Relayer info:', relayerInfo);
+  });
+
+runScript('get-relayer', getRelayer);
@@ -1,17 +1,14 @@
-import { begin } from '../helpers';
+import { runScript, withPlayground } from '../helpers';
 
-export const pauseUnpause = async () => {
-  const context = await begin();
+export const pauseUnpause = () =>
+  withPlayground(async (context) => {
+    console.log('Pausing relayer...');
+    await context.relayer.pause();
+    console.log('Relayer paused');
 
-  console.log('Pausing relayer...');
-  await context.relayer.pause();
-  console.log('Relayer paused');
+    console.log('Unpausing relayer...');
+    await context.relayer.unpause();
+    console.log('Relayer unpaused');
+  });
 
-  console.log('Unpausing relayer...');
-  await context.relayer.unpause();
-  console.log('Relayer unpaused');
-
-  await context.end();
-};
-
-pauseUnpause().then(() => console.log('pause-unpause done'));
+runScript('pause-unpause', pauseUnpause);
@@ -1,17 +1,14 @@
-import { begin } from '../helpers';
+import { runScript, withPlayground } from '../helpers';
 
-export const signTextHistory = async () => {
-  const context = await begin();
+export const signTextHistory = () =>
+  withPlayground(async (context) => {
+    console.log('Getting signing text history...');
+    const result = await context.relayer.sign.textHistory({
+      limit: 100,
+      offset: 0,
+    });
 
-  console.log('Getting signing text history...');
-  const result = await context.relayer.sign.textHistory({
-    limit: 100,
-    offset: 0,
+    console.log('result:', result);
   });
 
-  console.log('result:', result);
-
-  await context.end();
-};
-
-signTextHistory().then(() => console.log('sign-text-history done'));
+runScript('sign-text-history', signTextHistory);
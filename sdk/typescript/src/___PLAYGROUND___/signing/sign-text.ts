@@ -1,16 +1,15 @@
-import { begin } from '../helpers';
+import { runScript, withPlayground } from '../helpers';
 
-export const signText = async () => {
-  const context = await begin();
+const MESSAGE_PREFIX = 'Hello from SDK test at ';
 
-  console.log('Signing text message...');
-  const message = `Hello from SDK test at ${new Date().toISOString()}`;
-  const signature = await context.relayer.sign.text(message);
+export const signText = () =>
+  withPlayground(async (context) => {
+    console.log('Signing text message...');
+    const message = `${MESSAGE_PREFIX}${process.hrtime.bigint()}`;
+    const signature = await context.relayer.sign.text(message);
 
-  console.log('Message:', message);
-  console.log('Signature:', signature);
+    console.log('Message:', message);
+    console.log('Signature:', signature);
+  });
 
-  await context.end();
-};
-
-signText().then(() => console.log('sign-text done'));
+runScript('sign-text', signText);
@@ -1,17 +1,20 @@
-import { begin } from '../helpers';
+import { runScript, withPlayground } from '../helpers';
+import { personTypedData } from './typed-data';
 
-export const signTypedDataHistory = async () => {
-  const context = await begin();
+export const signTypedDataHistory = () =>
+  withPlayground(async (context) => {
+    console.log('Signing typed data...');
+    await context.relayer.sign.typedData(
+      personTypedData(context.relayerInfo.address)
+    );
 
-  console.log('Getting signing text history...');
-  const result = await context.relayer.sign.typedDataHistory({
-    limit: 100,
-    offset: 0,
-  });
-
-  console.log('result:', result);
+    console.log('Getting signing typed data history...');
+    const result = await context.relayer.sign.typedDataHistory({
+      limit: 100,
+      offset: 0,
+    });
 
-  await context.end();
-};
+    console.log('result:', result);
+  });
 
-signTypedDataHistory().then(() => console.log('sign-typed-data-history done'));
+runScript('sign-typed-data-history', signTypedDataHistory);
@@ -1,45 +1,17 @@
-import { begin } from '../helpers';
+import { runScript, withPlayground } from '../helpers';
+import { personTypedData } from './typed-data';
 
-export const signTypedData = async () => {
-  const context = await begin();
+export const signTypedData = () =>
+  withPlayground(async (context) => {
+    console.log('Signing typed data...');
 
-  console.log('Signing typed data...');
+    const typedData = personTypedData(context.relayerInfo.address);
+    const signature = await context.relayer.sign.typedData(typedData);
 
-  const domain = {
-    name: 'Test App',
-    version: '1',
-    chainId: 31337,
-    verifyingContract:
-      '0x1234567890123456789012345678901234567890' as `0x${string}`,
-  };
+    console.log('Domain:', typedData.domain);
+    console.log('Types:', typedData.types);
+    console.log('Value:', typedData.message);
+    console.log('Signature:', signature);
+  });
 
-  const types = {
-    Person: [
-      { name: 'name', type: 'string' },
-      { name: 'wallet', type: 'address' },
-    ],
-  };
-
-  const value = {
-    name: 'Alice',
-    wallet: context.relayerInfo.address,
-  };
-
-  const typedData = {
-    domain,
-    types,
-    primaryType: 'Person' as const,
-    message: value,
-  };
-
-  const signature = await context.relayer.sign.typedData(typedData);
-
-  console.log('Domain:', domain);
-  console.log('Types:', types);
-  console.log('Value:', value);
-  console.log('Signature:', signature);
-
-  await context.end();
-};
-
-signTypedData().then(() => console.log('sign-typed-data done'));
+runScript('sign-typed-data', signTypedData);
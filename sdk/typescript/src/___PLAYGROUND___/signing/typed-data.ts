@@ -0,0 +1,25 @@
+// Only the message depends on the relayer, the domain and types are fixed
+export const domain = {
+  name: 'Test App',
+  version: '1',
+  chainId: 31337,
+  verifyingContract:
+    '0x1234567890123456789012345678901234567890' as `0x${string}`,
+};
+
+export const types = {
+  Person: [
+    { name: 'name', type: 'string' },
+    { name: 'wallet', type: 'address' },
+  ],
+};
+
+export const personTypedData = (wallet: string) => ({
+  domain,
+  types,
+  primaryType: 'Person' as const,
+  message: {
+    name: 'Alice',
+    wallet,
+  },
+});
@@ -0,0 +1,3 @@
+import { runScript, stopKeptAliveStack } from './helpers';
+
+runScript('stop-playground', stopKeptAliveStack);
@@ -1,13 +1,10 @@
-import { begin } from '../helpers';
+import { runScript, withPlayground } from '../helpers';
 
-export const getAllTransactions = async () => {
-  const context = await begin();
+export const getAllTransactions = () =>
+  withPlayground(async (context) => {
+    console.log('Getting all transactions...');
+    const transactions = await context.relayer.transaction.getAll();
+    console.log('All transactions:', transactions);
+  });
 
-  console.log('Getting all transactions...');
-  const transactions = await context.relayer.transaction.getAll();
-  console.log('All transactions:', transactions);
-
-  await context.end();
-};
-
-getAllTransactions().then(() => console.log('get-all-transactions done'));
+runScript('get-all-transactions', getAllTransactions);
@@ -1,22 +1,17 @@
-import { begin } from '../helpers';
+import { runScript, withPlayground } from '../helpers';
 import { TransactionCountType } from '../../clients';
 
-export const getTransactionCounts = async () => {
-  const context = await begin();
+export const getTransactionCounts = () =>
+  withPlayground(async (context) => {
+    console.log('Getting transaction counts...');
 
-  console.log('Getting transaction counts...');
+    // the counts are independent reads, so fetch them together
+    const [pendingCount, inmempoolCount] = await Promise.all([
+      context.relayer.transaction.getCount(TransactionCountType.PENDING),
+      context.relayer.transaction.getCount(TransactionCountType.INMEMPOOL),
+    ]);
+    console.log('Pending transactions:', pendingCount);
+    console.log('In mempool transactions:', inmempoolCount);
+  });
 
-  const pendingCount = await context.relayer.transaction.getCount(
-    TransactionCountType.PENDING
-  );
-  console.log('Pending transactions:', pendingCount);
-
-  const inmempoolCount = await context.relayer.transaction.getCount(
-    TransactionCountType.INMEMPOOL
-  );
-  console.log('In mempool transactions:', inmempoolCount);
-
-  await context.end();
-};
-
-getTransactionCounts().then(() => console.log('get-transaction-counts done'));
+runScript('get-transaction-counts', getTransactionCounts);
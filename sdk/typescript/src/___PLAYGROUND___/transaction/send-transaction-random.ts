@@ -1,25 +1,22 @@
-import { begin, getAnvilAccounts } from '../helpers';
+import { runScript, withPlayground } from '../helpers';
 import { parseEther } from '../../index';
 
-export const sendTransaction = async () => {
-  const context = await begin();
-  const accounts = getAnvilAccounts();
+export const sendTransaction = () =>
+  withPlayground(async (context) => {
+    console.log('Sending transaction...');
+    const txRequest = {
+      to: context.accounts[1].address,
+      value: parseEther('1'),
+    };
 
-  console.log('Sending transaction...');
-  const txRequest = {
-    to: accounts[1].address,
-    value: parseEther('1'),
-  };
+    const response = await context.client.transaction.sendRandom(1, txRequest);
+    console.log('Transaction sent:', response);
 
-  const response = await context.client.transaction.sendRandom(1, txRequest);
-  console.log('Transaction sent:', response);
+    let receipt =
+      await context.relayer.transaction.waitForTransactionReceiptById(
+        response.id
+      );
+    console.log('Transaction receipt:', receipt);
+  });
 
-  let receipt = await context.relayer.transaction.waitForTransactionReceiptById(
-    response.id
-  );
-  console.log('Transaction receipt:', receipt);
-
-  await context.end();
-};
-
-sendTransaction().then(() => console.log('send-transaction done'));
+runScript('send-transaction-random', sendTransaction);
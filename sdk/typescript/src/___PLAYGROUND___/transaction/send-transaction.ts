@@ -1,47 +1,41 @@
-import { begin, getAnvilAccounts } from '../helpers';
+import { runScript, withPlayground } from '../helpers';
 import { parseEther } from '../../index';
 
-export const sendTransaction = async () => {
-  const context = await begin();
-  const accounts = getAnvilAccounts();
+export const sendTransaction = () =>
+  withPlayground(async (context) => {
+    console.log('Sending transaction...');
+    const txRequest = {
+      to: context.accounts[1].address,
+      value: parseEther('1'),
+    };
 
-  console.log('Sending transaction...');
-  const txRequest = {
-    to: accounts[1].address,
-    value: parseEther('1'),
-  };
+    const response = await context.relayer.transaction.send(txRequest);
+    console.log('Transaction sent:', response);
 
-  const response = await context.relayer.transaction.send(txRequest);
-  console.log('Transaction sent:', response);
-
-  let receipt = await context.relayer.transaction.waitForTransactionReceiptById(
-    response.id
-  );
-  console.log('Transaction receipt:', receipt);
-
-  await context.end();
-};
+    let receipt =
+      await context.relayer.transaction.waitForTransactionReceiptById(
+        response.id
+      );
+    console.log('Transaction receipt:', receipt);
+  });
 
 // like for like
-export const sendTransactionLikeForLike = async () => {
-  const context = await begin();
-  const accounts = getAnvilAccounts();
-
-  console.log('Sending transaction...');
-  const txRequest = {
-    to: accounts[1].address,
-    value: '1000000000000000000',
-  };
-
-  const response = await context.relayer.transaction.send(txRequest);
-  console.log('Transaction sent:', response);
-
-  let receipt = await context.relayer.transaction.waitForTransactionReceiptById(
-    response.id
-  );
-  console.log('Transaction receipt:', receipt);
-
-  await context.end();
-};
-
-sendTransaction().then(() => console.log('send-transaction done'));
+export const sendTransactionLikeForLike = () =>
+  withPlayground(async (context) => {
+    console.log('Sending transaction...');
+    const txRequest = {
+      to: context.accounts[1].address,
+      value: '1000000000000000000',
+    };
+
+    const response = await context.relayer.transaction.send(txRequest);
+    console.log('Transaction sent:', response);
+
+    let receipt =
+      await context.relayer.transaction.waitForTransactionReceiptById(
+        response.id
+      );
+    console.log('Transaction receipt:', receipt);
+  });
+
+runScript('send-transaction', sendTransaction);
@@ -1,4 +1,4 @@
-import { begin, getAnvilAccounts } from '../helpers';
+import { runScript, withPlayground } from '../helpers';
 import {
   createPublicClient,
   createWalletClient,
@@ -6,37 +6,33 @@ import {
   parseEther,
 } from 'viem';
 
-export const sendTransaction = async () => {
-  const context = await begin();
-  const accounts = getAnvilAccounts();
+export const sendTransaction = () =>
+  withPlayground(async (context) => {
+    console.log('Sending transaction...');
 
-  console.log('Sending transaction...');
+    let chain = await context.relayer.getViemChain();
 
-  let chain = await context.relayer.getViemChain();
+    const walletClient = createWalletClient({
+      account: await context.relayer.address(),
+      chain,
+      transport: custom(context.relayer.ethereumProvider()),
+    });
 
-  const walletClient = createWalletClient({
-    account: await context.relayer.address(),
-    chain,
-    transport: custom(context.relayer.ethereumProvider()),
-  });
+    const publicClient = createPublicClient({
+      chain,
+      transport: await context.client.getViemHttp(chain.id),
+    });
 
-  const publicClient = createPublicClient({
-    chain,
-    transport: await context.client.getViemHttp(chain.id),
-  });
+    const hash = await walletClient.sendTransaction({
+      to: context.accounts[1].address,
+      value: parseEther('0.001'),
+    });
 
-  const hash = await walletClient.sendTransaction({
-    to: accounts[1].address,
-    value: parseEther('0.001'),
-  });
+    const receipt = await publicClient.waitForTransactionReceipt({
+      hash,
+    });
 
-  const receipt = await publicClient.waitForTransactionReceipt({
-    hash,
+    console.log('Transaction receipt:', receipt);
   });
 
-  console.log('Transaction receipt:', receipt);
-
-  await context.end();
-};
-
-sendTransaction().then(() => console.log('send-transaction done'));
+runScript('send-transaction', sendTransaction);
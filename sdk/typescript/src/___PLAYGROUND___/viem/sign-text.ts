@@ -1,27 +1,24 @@
-import { begin } from '../helpers';
+import { runScript, withPlayground } from '../helpers';
 import { createWalletClient, custom } from 'viem';
 
-export const signText = async () => {
-  const context = await begin();
+export const signText = () =>
+  withPlayground(async (context) => {
+    const walletClient = createWalletClient({
+      chain: await context.relayer.getViemChain(),
+      transport: custom(context.relayer.ethereumProvider()),
+    });
 
-  const walletClient = createWalletClient({
-    chain: await context.relayer.getViemChain(),
-    transport: custom(context.relayer.ethereumProvider()),
-  });
+    const [account] = await walletClient.getAddresses();
 
-  const [account] = await walletClient.getAddresses();
+    console.log('Signing text message...');
+    const message = `Hello from SDK using viem test at ${new Date().toISOString()}`;
+    const signature = await walletClient.signMessage({
+      account,
+      message,
+    });
 
-  console.log('Signing text message...');
-  const message = `Hello from SDK using viem test at ${new Date().toISOString()}`;
-  const signature = await walletClient.signMessage({
-    account,
-    message,
+    console.log('Message:', message);
+    console.log('Signature:', signature);
   });
 
-  console.log('Message:', message);
-  console.log('Signature:', signature);
-
-  await context.end();
-};
-
-signText().then(() => console.log('sign-text done'));
+runScript('sign-text', signText);
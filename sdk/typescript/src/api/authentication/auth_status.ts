@@ -19,12 +19,7 @@ export interface StatusResponse {
 export const auth_status = async (
   baseConfig: ApiBaseConfig
 ): Promise<StatusResponse> => {
-  try {
-    const result = await getApi<StatusResponse>(baseConfig, 'auth/status');
+  const result = await getApi<StatusResponse>(baseConfig, 'auth/status');
 
-    return result.data;
-  } catch (error) {
-    console.error('Failed to test auth status:', error);
-    throw error;
-  }
+  return result.data;
 };
@@ -5,14 +5,38 @@ import axios, {
 } from 'axios';
 import { ApiBaseConfig } from './types';
 
+// One instance shared by every client, so the default headers and the error
+// interceptor below are set up in one place. Connection pooling is unchanged,
+// it is still node's global http agent (or the browser's own pool)
+const api = axios.create({
+  headers: {
+    Accept: 'application/json',
+    'Content-Type': 'application/json',
+  },
+});
+
+// Every failed request is logged once here before the error is rethrown to
+// the caller, rather than by a try/catch in each api function
+api.interceptors.response.use(undefined, (error) => {
+  const method = error.config?.method?.toUpperCase();
+  console.error(`Failed to ${method} ${error.config?.url}:`, error);
+  return Promise.reject(error);
+});
+
 const buildUrl = (serverUrl: string, endpoint: string): string => {
   return `${serverUrl}/${endpoint}`;
 };
 
-const buildHeaders = (
-  baseConfig: ApiBaseConfig,
-  knownHeaders: RawAxiosRequestHeaders = {}
+// Credentials never change for a client's config, so the auth headers are
+// built once per config object instead of on every request
+const authHeadersCache = new WeakMap<ApiBaseConfig, RawAxiosRequestHeaders>();
+
+const buildAuthHeaders = (
+  baseConfig: ApiBaseConfig
 ): RawAxiosRequestHeaders => {
+  const cached = authHeadersCache.get(baseConfig);
+  if (cached) return cached;
+
   let headers: RawAxiosRequestHeaders = {};
   if ('apiKey' in baseConfig) {
     headers = {
@@ -29,10 +53,17 @@ const buildHeaders = (
     };
   }
 
+  authHeadersCache.set(baseConfig, headers);
+  return headers;
+};
+
+const buildHeaders = (
+  baseConfig: ApiBaseConfig,
+  knownHeaders: RawAxiosRequestHeaders = {}
+): RawAxiosRequestHeaders => {
   return {
     ...knownHeaders,
-    ...headers,
-    'Content-Type': 'application/json',
+    ...buildAuthHeaders(baseConfig),
   };
 };
 
@@ -42,7 +73,7 @@ export const getApi = async <T>(
   params?: any,
   config?: AxiosRequestConfig
 ): Promise<AxiosResponse<T>> => {
-  return axios.get<T>(buildUrl(baseConfig.serverUrl, endpoint), {
+  return api.get<T>(buildUrl(baseConfig.serverUrl, endpoint), {
     ...config,
     params,
     headers: buildHeaders(baseConfig, config?.headers),
@@ -55,7 +86,7 @@ export const postApi = async <T>(
   body?: any,
   config?: AxiosRequestConfig
 ): Promise<AxiosResponse<T>> => {
-  return axios.post<T>(buildUrl(baseConfig.serverUrl, endpoint), body, {
+  return api.post<T>(buildUrl(baseConfig.serverUrl, endpoint), body, {
     ...config,
     headers: buildHeaders(baseConfig, config?.headers),
   });
@@ -67,7 +98,7 @@ export const putApi = async <T>(
   body?: any,
   config?: AxiosRequestConfig
 ): Promise<AxiosResponse<T>> => {
-  return axios.put<T>(buildUrl(baseConfig.serverUrl, endpoint), body, {
+  return api.put<T>(buildUrl(baseConfig.serverUrl, endpoint), body, {
     ...config,
     headers: buildHeaders(baseConfig, config?.headers),
   });
@@ -78,7 +109,7 @@ export const deleteApi = async <T>(
   endpoint: string,
   config?: AxiosRequestConfig
 ): Promise<AxiosResponse<T>> => {
-  return axios.delete<T>(buildUrl(baseConfig.serverUrl, endpoint), {
+  return api.delete<T>(buildUrl(baseConfig.serverUrl, endpoint), {
     ...config,
     headers: buildHeaders(baseConfig, config?.headers),
   });
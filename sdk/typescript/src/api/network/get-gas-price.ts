@@ -24,14 +24,9 @@ export const getGasPrices = async (
   chainId: number,
   baseConfig: ApiBaseConfig
 ): Promise<GasEstimatorResult | null> => {
-  try {
-    const response = await getApi<GasEstimatorResult | null>(
-      baseConfig,
-      `networks/gas/price/${chainId}`
-    );
-    return response.data;
-  } catch (error: any) {
-    console.error('Failed to fetch gas prices:', error.message);
-    throw error;
-  }
+  const response = await getApi<GasEstimatorResult | null>(
+    baseConfig,
+    `networks/gas/price/${chainId}`
+  );
+  return response.data;
 };
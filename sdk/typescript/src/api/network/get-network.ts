@@ -6,14 +6,9 @@ export const getNetwork = async (
   chain_id: number,
   baseConfig: ApiBaseConfig
 ): Promise<Network | null> => {
-  try {
-    const response = await getApi<Network | null>(
-      baseConfig,
-      `networks/${chain_id}`
-    );
-    return response.data;
-  } catch (error) {
-    console.error('Failed to fetch all networks:', error);
-    throw error;
-  }
+  const response = await getApi<Network | null>(
+    baseConfig,
+    `networks/${chain_id}`
+  );
+  return response.data;
 };
@@ -6,16 +6,11 @@ export const getRelayerAllowlistAddress = async (
   pagingContext: PagingContext,
   baseConfig: ApiBaseConfig
 ): Promise<PagingResult<`0x${string}`>> => {
-  try {
-    const response = await getApi<PagingResult<`0x${string}`>>(
-      baseConfig,
-      `relayers/${relayerId}/allowlists`,
-      { ...pagingContext }
-    );
+  const response = await getApi<PagingResult<`0x${string}`>>(
+    baseConfig,
+    `relayers/${relayerId}/allowlists`,
+    pagingContext
+  );
 
-    return response.data;
-  } catch (error) {
-    console.error('Failed to getRelayerAllowlistAddress:', error);
-    throw error;
-  }
+  return response.data;
 };
@@ -2,24 +2,25 @@ import { postApi } from '../axios-wrapper';
 import { ApiBaseConfig } from '../types';
 import { CreateRelayerResult } from './create-relayer';
 
+export interface CloneRelayerRequest {
+  newRelayerName: string;
+  chainId: number;
+}
+
 export const cloneRelayer = async (
   id: string,
   chainId: number,
   name: string,
   baseConfig: ApiBaseConfig
 ): Promise<CreateRelayerResult> => {
-  try {
-    const response = await postApi<CreateRelayerResult>(
-      baseConfig,
-      `relayers/${id}/clone`,
-      {
-        newRelayerName: name,
-        chainId: chainId,
-      }
-    );
-    return response.data;
-  } catch (error) {
-    console.error('Failed to clone relayer:', error);
-    throw error;
-  }
+  const body: CloneRelayerRequest = {
+    newRelayerName: name,
+    chainId: chainId,
+  };
+  const response = await postApi<CreateRelayerResult>(
+    baseConfig,
+    `relayers/${id}/clone`,
+    body
+  );
+  return response.data;
 };
@@ -1,6 +1,10 @@
 import { postApi } from '../axios-wrapper';
 import { ApiBaseConfig } from '../types';
 
+export interface CreateRelayerRequest {
+  name: string;
+}
+
 export interface CreateRelayerResult {
   id: string;
   address: string;
@@ -11,15 +15,11 @@ export const createRelayer = async (
   name: string,
   baseConfig: ApiBaseConfig
 ): Promise<CreateRelayerResult> => {
-  try {
-    const response = await postApi<CreateRelayerResult>(
-      baseConfig,
-      `relayers/${chainId}/new`,
-      { name }
-    );
-    return response.data;
-  } catch (error) {
-    console.error('Failed to createRelayer', error);
-    throw error;
-  }
+  const body: CreateRelayerRequest = { name };
+  const response = await postApi<CreateRelayerResult>(
+    baseConfig,
+    `relayers/${chainId}/new`,
+    body
+  );
+  return response.data;
 };
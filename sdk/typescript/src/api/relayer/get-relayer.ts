@@ -11,14 +11,9 @@ export const getRelayer = async (
   id: string,
   baseConfig: ApiBaseConfig
 ): Promise<GetRelayerResult | null> => {
-  try {
-    const response = await getApi<GetRelayerResult | null>(
-      baseConfig,
-      `relayers/${id}`
-    );
-    return response.data;
-  } catch (error) {
-    console.error('Failed to fetch getRelayer:', error);
-    throw error;
-  }
+  const response = await getApi<GetRelayerResult | null>(
+    baseConfig,
+    `relayers/${id}`
+  );
+  return response.data;
 };
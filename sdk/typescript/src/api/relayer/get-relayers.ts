@@ -7,16 +7,12 @@ export const getRelayers = async (
   pagingContext: PagingContext,
   baseConfig: ApiBaseConfig
 ): Promise<PagingResult<Relayer>> => {
-  try {
-    const response = await getApi<PagingResult<Relayer>>(
-      baseConfig,
-      'relayers',
-      { chainId, ...pagingContext }
-    );
+  const response = await getApi<PagingResult<Relayer>>(
+    baseConfig,
+    'relayers',
+    // only copy the paging context when there is a chain id to add to it
+    chainId === undefined ? pagingContext : { chainId, ...pagingContext }
+  );
 
-    return response.data;
-  } catch (error) {
-    console.error('Failed to fetch getRelayers', error);
-    throw error;
-  }
+  return response.data;
 };
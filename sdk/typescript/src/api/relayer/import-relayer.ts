@@ -21,15 +21,11 @@ export const importRelayer = async (
   address: string,
   baseConfig: ApiBaseConfig
 ): Promise<ImportRelayerResult> => {
-  try {
-    const response = await postApi<ImportRelayerResult>(
-      baseConfig,
-      `relayers/${chainId}/import`,
-      { name, keyId, address }
-    );
-    return response.data;
-  } catch (error) {
-    console.error('Failed to import relayer', error);
-    throw error;
-  }
+  const body: ImportRelayerRequest = { name, keyId, address };
+  const response = await postApi<ImportRelayerResult>(
+    baseConfig,
+    `relayers/${chainId}/import`,
+    body
+  );
+  return response.data;
 };
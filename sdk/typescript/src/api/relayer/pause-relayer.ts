@@ -5,10 +5,5 @@ export const pauseRelayer = async (
   relayerId: string,
   baseConfig: ApiBaseConfig
 ): Promise<void> => {
-  try {
-    await putApi(baseConfig, `relayers/${relayerId}/pause`);
-  } catch (error) {
-    console.error('Failed to pauseRelayer:', error);
-    throw error;
-  }
+  await putApi(baseConfig, `relayers/${relayerId}/pause`);
 };
@@ -5,10 +5,5 @@ export const removeRelayerMaxGasPrice = async (
   relayerId: string,
   baseConfig: ApiBaseConfig
 ): Promise<void> => {
-  try {
-    await putApi(baseConfig, `relayers/${relayerId}/gas/max/0`);
-  } catch (error) {
-    console.error('Failed to removeRelayerMaxGasPrice:', error);
-    throw error;
-  }
+  await putApi(baseConfig, `relayers/${relayerId}/gas/max/0`);
 };
@@ -5,10 +5,5 @@ export const unpauseRelayer = async (
   relayerId: string,
   baseConfig: ApiBaseConfig
 ): Promise<void> => {
-  try {
-    await putApi(baseConfig, `relayers/${relayerId}/unpause`);
-  } catch (error) {
-    console.error('Failed to unpauseRelayer:', error);
-    throw error;
-  }
+  await putApi(baseConfig, `relayers/${relayerId}/unpause`);
 };
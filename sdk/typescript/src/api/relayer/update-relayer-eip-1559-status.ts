@@ -6,10 +6,5 @@ export const updateRelayerEIP1559Status = async (
   status: boolean,
   baseConfig: ApiBaseConfig
 ): Promise<void> => {
-  try {
-    await putApi(baseConfig, `relayers/${relayerId}/gas/eip1559/${status}`);
-  } catch (error) {
-    console.error('Failed to updateRelayerEIP1559Status:', error);
-    throw error;
-  }
+  await putApi(baseConfig, `relayers/${relayerId}/gas/eip1559/${status}`);
 };
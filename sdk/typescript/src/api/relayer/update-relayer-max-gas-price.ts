@@ -6,10 +6,5 @@ export const updateRelayerMaxGasPrice = async (
   cap: string,
   baseConfig: ApiBaseConfig
 ): Promise<void> => {
-  try {
-    await putApi(baseConfig, `relayers/${relayerId}/gas/max/${cap}`);
-  } catch (error) {
-    console.error('Failed to updateRelayerEIP1559Status:', error);
-    throw error;
-  }
+  await putApi(baseConfig, `relayers/${relayerId}/gas/max/${cap}`);
 };
@@ -14,16 +14,11 @@ export const getSignedTextHistory = async (
   pagingContext: PagingContext,
   baseConfig: ApiBaseConfig
 ): Promise<PagingResult<SignedTextHistory>> => {
-  try {
-    const response = await getApi<PagingResult<SignedTextHistory>>(
-      baseConfig,
-      `signing/relayers/${relayerId}/text-history`,
-      { ...pagingContext }
-    );
+  const response = await getApi<PagingResult<SignedTextHistory>>(
+    baseConfig,
+    `signing/relayers/${relayerId}/text-history`,
+    pagingContext
+  );
 
-    return response.data;
-  } catch (error) {
-    console.error('Failed to getSignedTextHistory:', error);
-    throw error;
-  }
+  return response.data;
 };
@@ -16,16 +16,11 @@ export const getSignedTypedDataHistory = async (
   pagingContext: PagingContext,
   baseConfig: ApiBaseConfig
 ): Promise<PagingResult<SignedTypedDataHistory>> => {
-  try {
-    const response = await getApi<PagingResult<SignedTypedDataHistory>>(
-      baseConfig,
-      `signing/relayers/${relayerId}/typed-data-history`,
-      { ...pagingContext }
-    );
+  const response = await getApi<PagingResult<SignedTypedDataHistory>>(
+    baseConfig,
+    `signing/relayers/${relayerId}/typed-data-history`,
+    pagingContext
+  );
 
-    return response.data;
-  } catch (error) {
-    console.error('Failed to getSignedTypedDataHistory:', error);
-    throw error;
-  }
+  return response.data;
 };
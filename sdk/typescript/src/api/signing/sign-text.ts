@@ -14,23 +14,18 @@ export const signText = async (
   rateLimitKey: string | undefined,
   baseConfig: ApiBaseConfig
 ): Promise<SignTextResult> => {
-  try {
-    const config: any = {};
-    if (rateLimitKey) {
-      config.headers = {
-        [RATE_LIMIT_HEADER_NAME]: rateLimitKey,
-      };
-    }
-
-    const response = await postApi<SignTextResult>(
-      baseConfig,
-      `signing/relayers/${relayerId}/message`,
-      { text },
-      config
-    );
-    return response.data;
-  } catch (error) {
-    console.error('Failed to signText', error);
-    throw error;
+  const config: any = {};
+  if (rateLimitKey) {
+    config.headers = {
+      [RATE_LIMIT_HEADER_NAME]: rateLimitKey,
+    };
   }
+
+  const response = await postApi<SignTextResult>(
+    baseConfig,
+    `signing/relayers/${relayerId}/message`,
+    { text },
+    config
+  );
+  return response.data;
 };
@@ -13,23 +13,18 @@ export const signTypedData = async (
   rateLimitKey: string | undefined,
   baseConfig: ApiBaseConfig
 ): Promise<SignTypedDataResult> => {
-  try {
-    const config: any = {};
-    if (rateLimitKey) {
-      config.headers = {
-        [RATE_LIMIT_HEADER_NAME]: rateLimitKey,
-      };
-    }
-
-    const response = await postApi<SignTypedDataResult>(
-      baseConfig,
-      `signing/relayers/${relayerId}/typed-data`,
-      typedData,
-      config
-    );
-    return response.data;
-  } catch (error) {
-    console.error('Failed to signTypedData', error);
-    throw error;
+  const config: any = {};
+  if (rateLimitKey) {
+    config.headers = {
+      [RATE_LIMIT_HEADER_NAME]: rateLimitKey,
+    };
   }
+
+  const response = await postApi<SignTypedDataResult>(
+    baseConfig,
+    `signing/relayers/${relayerId}/typed-data`,
+    typedData,
+    config
+  );
+  return response.data;
 };
@@ -16,23 +16,18 @@ export const cancelTransaction = async (
   rateLimitKey: string | undefined,
   baseConfig: ApiBaseConfig
 ): Promise<CancelTransactionResult> => {
-  try {
-    const config: any = {};
-    if (rateLimitKey) {
-      config.headers = {
-        [RATE_LIMIT_HEADER_NAME]: rateLimitKey,
-      };
-    }
-
-    const response = await putApi<CancelTransactionResult>(
-      baseConfig,
-      `transactions/cancel/${transactionId}`,
-      {},
-      config
-    );
-    return response.data;
-  } catch (error) {
-    console.error('Failed to cancelTransaction', error);
-    throw error;
+  const config: any = {};
+  if (rateLimitKey) {
+    config.headers = {
+      [RATE_LIMIT_HEADER_NAME]: rateLimitKey,
+    };
   }
+
+  const response = await putApi<CancelTransactionResult>(
+    baseConfig,
+    `transactions/cancel/${transactionId}`,
+    {},
+    config
+  );
+  return response.data;
 };
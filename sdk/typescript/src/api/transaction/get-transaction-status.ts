@@ -13,14 +13,9 @@ export const getTransactionStatus = async (
   transactionId: string,
   baseConfig: ApiBaseConfig
 ): Promise<TransactionStatusResult | null> => {
-  try {
-    const response = await getApi<TransactionStatusResult | null>(
-      baseConfig,
-      `transactions/status/${transactionId}`
-    );
-    return response.data;
-  } catch (error) {
-    console.error('Failed to fetch getTransactionStatus:', error);
-    throw error;
-  }
+  const response = await getApi<TransactionStatusResult | null>(
+    baseConfig,
+    `transactions/status/${transactionId}`
+  );
+  return response.data;
 };
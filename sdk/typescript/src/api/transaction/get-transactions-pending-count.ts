@@ -5,14 +5,9 @@ export const getTransactionsPendingCount = async (
   relayerId: string,
   baseConfig: ApiBaseConfig
 ): Promise<number> => {
-  try {
-    const response = await getApi<number>(
-      baseConfig,
-      `transactions/relayers/${relayerId}/pending/count`
-    );
-    return response.data;
-  } catch (error) {
-    console.error('Failed to fetch getTransactionsPendingCount:', error);
-    throw error;
-  }
+  const response = await getApi<number>(
+    baseConfig,
+    `transactions/relayers/${relayerId}/pending/count`
+  );
+  return response.data;
 };
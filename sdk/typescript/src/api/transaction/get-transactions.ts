@@ -7,15 +7,10 @@ export const getTransactions = async (
   pagingContext: PagingContext,
   baseConfig: ApiBaseConfig
 ): Promise<PagingResult<Transaction>> => {
-  try {
-    const response = await getApi<PagingResult<Transaction>>(
-      baseConfig,
-      `transactions/relayers/${relayerId}`,
-      { ...pagingContext }
-    );
-    return response.data;
-  } catch (error) {
-    console.error('Failed to fetch getTransactions:', error);
-    throw error;
-  }
+  const response = await getApi<PagingResult<Transaction>>(
+    baseConfig,
+    `transactions/relayers/${relayerId}`,
+    pagingContext
+  );
+  return response.data;
 };
@@ -2,6 +2,7 @@ import { putApi } from '../axios-wrapper';
 import { ApiBaseConfig } from '../types';
 import { TransactionToSend } from './types';
 import { RATE_LIMIT_HEADER_NAME } from '../index';
+import { toTransactionBody } from './to-transaction-body';
 
 export type ReplaceTransactionResult =
   | {
@@ -19,25 +20,18 @@ export const replaceTransaction = async (
   rateLimitKey: string | undefined,
   baseConfig: ApiBaseConfig
 ): Promise<ReplaceTransactionResult> => {
-  try {
-    const config: any = {};
-    if (rateLimitKey) {
-      config.headers = {
-        [RATE_LIMIT_HEADER_NAME]: rateLimitKey,
-      };
-    }
-
-    const response = await putApi<ReplaceTransactionResult>(
-      baseConfig,
-      `transactions/replace/${transactionId}`,
-      {
-        ...replacementTransaction,
-      },
-      config
-    );
-    return response.data;
-  } catch (error) {
-    console.error('Failed to replaceTransaction', error);
-    throw error;
+  const config: any = {};
+  if (rateLimitKey) {
+    config.headers = {
+      [RATE_LIMIT_HEADER_NAME]: rateLimitKey,
+    };
   }
+
+  const response = await putApi<ReplaceTransactionResult>(
+    baseConfig,
+    `transactions/replace/${transactionId}`,
+    toTransactionBody(replacementTransaction),
+    config
+  );
+  return response.data;
 };
@@ -2,6 +2,7 @@ import { postApi } from '../axios-wrapper';
 import { ApiBaseConfig } from '../types';
 import { TransactionSent, TransactionToSend } from './types';
 import { RATE_LIMIT_HEADER_NAME } from '../index';
+import { toTransactionBody } from './to-transaction-body';
 
 export const sendTransaction = async (
   relayerId: string,
@@ -9,25 +10,18 @@ export const sendTransaction = async (
   rateLimitKey: string | undefined,
   baseConfig: ApiBaseConfig
 ): Promise<TransactionSent> => {
-  try {
-    const config: any = {};
-    if (rateLimitKey) {
-      config.headers = {
-        [RATE_LIMIT_HEADER_NAME]: rateLimitKey,
-      };
-    }
-
-    const response = await postApi<TransactionSent>(
-      baseConfig,
-      `transactions/relayers/${relayerId}/send`,
-      {
-        ...transactionToSend,
-      },
-      config
-    );
-    return response.data;
-  } catch (error) {
-    console.error('Failed to sendTransaction', error);
-    throw error;
+  const config: any = {};
+  if (rateLimitKey) {
+    config.headers = {
+      [RATE_LIMIT_HEADER_NAME]: rateLimitKey,
+    };
   }
+
+  const response = await postApi<TransactionSent>(
+    baseConfig,
+    `transactions/relayers/${relayerId}/send`,
+    toTransactionBody(transactionToSend),
+    config
+  );
+  return response.data;
 };
@@ -0,0 +1,17 @@
+import { TransactionToSend } from './types';
+
+/**
+ * The request body for a transaction, JSON can not encode a bigint so a bigint
+ * value is sent as its decimal string
+ *
+ * @param transaction - The transaction to send
+ */
+export const toTransactionBody = (
+  transaction: TransactionToSend
+): TransactionToSend => {
+  if (typeof transaction.value === 'bigint') {
+    return { ...transaction, value: transaction.value.toString() };
+  }
+
+  return transaction;
+};
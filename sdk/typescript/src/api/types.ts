@@ -9,15 +9,48 @@ export type ApiBaseConfig =
       password: string;
     };
 
+export type ApiAuth =
+  | {
+      apiKey: string;
+    }
+  | {
+      username: string;
+      password: string;
+    };
+
+/**
+ * Build the api config for a client once, it is frozen so the auth headers
+ * cached against it in the axios wrapper can never go stale
+ *
+ * @param serverUrl - The rrelayer server url
+ * @param auth - Either the relayer api key or the basic auth credentials
+ */
+export const toApiBaseConfig = (
+  serverUrl: string,
+  auth: ApiAuth
+): Readonly<ApiBaseConfig> => {
+  if ('apiKey' in auth) {
+    return Object.freeze({ serverUrl, apiKey: auth.apiKey });
+  }
+
+  return Object.freeze({
+    serverUrl,
+    username: auth.username,
+    password: auth.password,
+  });
+};
+
 export interface PagingContext {
   limit: number;
   offset: number;
 }
 
-export const defaultPagingContext: PagingContext = {
+// Frozen because it is the shared default for every paged call and is sent
+// to the server as is
+export const defaultPagingContext: Readonly<PagingContext> = Object.freeze({
   limit: 100,
   offset: 0,
-};
+});
 
 export interface PagingResult<T> {
   items: T[];
@@ -10,8 +10,10 @@ import {
   CreateRelayerResult,
   cloneRelayer,
 } from '../api';
+import { Address } from 'viem';
 import { RelayerClient } from './relayer';
 import { TransactionCountType } from './types';
+import { cacheGetter } from '../utils';
 
 export interface AdminRelayerClientConfig {
   serverUrl: string;
@@ -22,17 +24,12 @@ export interface AdminRelayerClientConfig {
     password: string;
   };
   fallbackSpeed?: TransactionSpeed;
+  address?: Address;
 }
 
 export class AdminRelayerClient extends RelayerClient {
   constructor(config: AdminRelayerClientConfig) {
-    super({
-      serverUrl: config.serverUrl,
-      providerUrl: config.providerUrl,
-      relayerId: config.relayerId,
-      auth: config.auth,
-      fallbackSpeed: config.fallbackSpeed,
-    });
+    super(config);
   }
 
   /**
@@ -81,7 +78,7 @@ export class AdminRelayerClient extends RelayerClient {
    * Transaction methods
    */
   public get transaction() {
-    return {
+    return cacheGetter(this, 'transaction', {
       ...super.transaction,
       /**
        * Get the count of transactions
@@ -98,7 +95,7 @@ export class AdminRelayerClient extends RelayerClient {
             throw new Error('Invalid transaction count type');
         }
       },
-    };
+    });
   }
 
   /**
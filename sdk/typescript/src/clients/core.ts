@@ -30,9 +30,14 @@ import {
   defaultPagingContext,
   PagingContext,
   PagingResult,
+  toApiBaseConfig,
 } from '../api/types';
 import { AdminRelayerClient } from './admin';
 import { http } from 'viem';
+import { cacheGetter, TtlCache } from '../utils';
+
+// network metadata only changes when the server config changes
+const NETWORK_CACHE_TTL_MS = 30 * 1000;
 
 export interface CreateClientConfig {
   serverUrl: string;
@@ -52,23 +57,25 @@ export interface CreateRelayerClientConfig {
 
 export class Client {
   private readonly _apiBaseConfig: ApiBaseConfig;
+  private readonly _networkCache = new TtlCache<number, Network | null>(
+    NETWORK_CACHE_TTL_MS
+  );
+  private readonly _allNetworksCache = new TtlCache<'all', Network[]>(
+    NETWORK_CACHE_TTL_MS
+  );
   constructor(private readonly _config: CreateClientConfig) {
-    this._apiBaseConfig = {
-      serverUrl: _config.serverUrl,
-      username: _config.auth.username,
-      password: _config.auth.password,
-    };
+    this._apiBaseConfig = toApiBaseConfig(_config.serverUrl, _config.auth);
   }
 
   public get relayer() {
-    return {
+    return cacheGetter(this, 'relayer', {
       /**
        * Create a new relayer
        * @param chainId The chain id to create the relayer on
        * @param name The name of the relayer
        * @returns Promise<CreateRelayerResult>
        */
-      create: async (
+      create: (
         chainId: number,
         name: string
       ): Promise<CreateRelayerResult> => {
@@ -81,7 +88,7 @@ export class Client {
        * @param name The name of the new relayer
        * @returns Promise<CreateRelayerResult>
        */
-      clone: async (
+      clone: (
         relayerId: string,
         chainId: number,
         name: string
@@ -96,7 +103,7 @@ export class Client {
        * @param address The Ethereum address derived from the key
        * @returns Promise<ImportRelayerResult>
        */
-      import: async (
+      import: (
         chainId: number,
         name: string,
         keyId: string,
@@ -108,7 +115,7 @@ export class Client {
        * Delete a relayer
        * @returns void
        */
-      delete: async (id: string): Promise<void> => {
+      delete: (id: string): Promise<void> => {
         return deleteRelayer(id, this._apiBaseConfig);
       },
       /**
@@ -116,7 +123,7 @@ export class Client {
        * @param id The id of the relayer
        * @returns Relayer
        */
-      get: async (id: string): Promise<GetRelayerResult | null> => {
+      get: (id: string): Promise<GetRelayerResult | null> => {
         return getRelayer(id, this._apiBaseConfig);
       },
       /**
@@ -125,31 +132,36 @@ export class Client {
        * @param onlyForChainId If you only want it based on a chain id
        * @returns Relayer
        */
-      getAll: async (
+      getAll: (
         pagingContext: PagingContext = defaultPagingContext,
         onlyForChainId?: number
       ): Promise<PagingResult<Relayer>> => {
         return getRelayers(onlyForChainId, pagingContext, this._apiBaseConfig);
       },
-    };
+    });
   }
 
   public get network() {
     const apiBaseConfig = this._apiBaseConfig;
-    return {
+    return cacheGetter(this, 'network', {
       /**
-       * get all networks
-       * @returns Network array
+       * get a network, cached for 30 seconds
+       * @param chainId The chain id
+       * @returns Network | null
        */
-      get: async (chainId: number): Promise<Network | null> => {
-        return getNetwork(chainId, apiBaseConfig);
+      get: (chainId: number): Promise<Network | null> => {
+        return this._networkCache.get(chainId, () =>
+          getNetwork(chainId, apiBaseConfig)
+        );
       },
       /**
-       * get all networks
+       * get all networks, cached for 30 seconds
        * @returns Network array
        */
       getAll: (): Promise<Network[]> => {
-        return getAllNetworks(apiBaseConfig);
+        return this._allNetworksCache.get('all', () =>
+          getAllNetworks(apiBaseConfig)
+        );
       },
       /**
        * Get gas prices for the network
@@ -158,11 +170,11 @@ export class Client {
       getGasPrices(chainId: number): Promise<GasEstimatorResult | null> {
         return getGasPrices(chainId, apiBaseConfig);
       },
-    };
+    });
   }
 
   public get transaction() {
-    return {
+    return cacheGetter(this, 'transaction', {
       /**
        * Get a transaction
        * @param transactionId The transaction id
@@ -200,11 +212,11 @@ export class Client {
           this._apiBaseConfig
         );
       },
-    };
+    });
   }
 
   public get allowlist() {
-    return {
+    return cacheGetter(this, 'allowlist', {
       /**
        * Get the relayer allowlist
        * @returns An address of allowlist addresses
@@ -219,7 +231,7 @@ export class Client {
           this._apiBaseConfig
         );
       },
-    };
+    });
   }
 
   /**
@@ -239,10 +251,11 @@ export class Client {
 
     return new AdminRelayerClient({
       serverUrl: this._config.serverUrl,
-      providerUrl: 'TODO',
+      providerUrl: relayer.providerUrls[0],
       relayerId,
       auth: this._config.auth,
       fallbackSpeed: defaultSpeed,
+      address: relayer.relayer.address,
     });
   }
 
@@ -6,7 +6,6 @@ import {
   formatEther,
   defineChain,
 } from 'viem';
-import * as knownChains from 'viem/chains';
 import {
   Relayer,
   Transaction,
@@ -31,13 +30,15 @@ import {
   ReplaceTransactionResult,
 } from '../api';
 import {
+  ApiAuth,
   ApiBaseConfig,
   PagingContext,
   PagingResult,
   defaultPagingContext,
+  toApiBaseConfig,
 } from '../api/types';
 import { Provider } from '../provider';
-import { invariant } from '../utils';
+import { cacheGetter, invariant, paginate } from '../utils';
 import {
   signText,
   SignTextResult,
@@ -45,19 +46,44 @@ import {
   SignTypedDataResult,
 } from '../api';
 
+let knownChainsById: Promise<Map<number, Chain>> | undefined;
+
+/**
+ * Index viem's known chains by id once, instead of scanning every chain on
+ * each lookup. viem/chains is large and only needed by getViemChain, so it is
+ * loaded on the first lookup rather than when the sdk is imported
+ */
+const getKnownChainsById = (): Promise<Map<number, Chain>> => {
+  if (!knownChainsById) {
+    knownChainsById = import('viem/chains').then((knownChains) => {
+      const byId = new Map<number, Chain>();
+      for (const chain of Object.values(knownChains)) {
+        // first one wins, matching the order the old linear search found them
+        if ('id' in chain && !byId.has(chain.id)) {
+          byId.set(chain.id, chain);
+        }
+      }
+
+      return byId;
+    });
+  }
+
+  return knownChainsById;
+};
+
 export interface RelayerClientConfig {
   serverUrl: string;
   providerUrl: string;
   relayerId: string;
-  auth:
-    | {
-        apiKey: string;
-      }
-    | {
-        username: string;
-        password: string;
-      };
+  auth: ApiAuth;
   fallbackSpeed?: TransactionSpeed;
+  /**
+   * The relayer address when the caller already has it, saves a round trip
+   * on `address()`. It is trusted as is and never checked against the server,
+   * a wrong address makes `address()` and `getBalanceOf()` report the wrong
+   * account
+   */
+  address?: Address;
 }
 
 export class RelayerClient {
@@ -65,22 +91,14 @@ export class RelayerClient {
   public readonly fallbackSpeed: TransactionSpeed | undefined = undefined;
   protected readonly _apiBaseConfig: ApiBaseConfig;
   private readonly _ethereumProvider: Provider;
+  // the address never changes for a relayer id
+  private _address: Address | undefined;
   constructor(config: RelayerClientConfig) {
     this.id = config.relayerId;
     this.fallbackSpeed = config.fallbackSpeed;
+    this._address = config.address;
     this._ethereumProvider = new Provider(config.providerUrl, this);
-    if ('apiKey' in config.auth) {
-      this._apiBaseConfig = {
-        serverUrl: config.serverUrl,
-        apiKey: config.auth.apiKey,
-      };
-    } else {
-      this._apiBaseConfig = {
-        serverUrl: config.serverUrl,
-        username: config.auth.username,
-        password: config.auth.password,
-      };
-    }
+    this._apiBaseConfig = toApiBaseConfig(config.serverUrl, config.auth);
   }
 
   /**
@@ -88,7 +106,11 @@ export class RelayerClient {
    * @returns string
    */
   public async address(): Promise<Address> {
-    return (await this.getInfo()).address;
+    if (!this._address) {
+      this._address = (await this.getInfo()).address;
+    }
+
+    return this._address;
   }
 
   /**
@@ -117,7 +139,7 @@ export class RelayerClient {
   }
 
   public get allowlist() {
-    return {
+    return cacheGetter(this, 'allowlist', {
       /**
        * Get the relayer allowlist
        * @returns An address of allowlist addresses
@@ -131,11 +153,11 @@ export class RelayerClient {
           this._apiBaseConfig
         );
       },
-    };
+    });
   }
 
   public get sign() {
-    return {
+    return cacheGetter(this, 'sign', {
       /**
        * Sign a message
        * @param message The message to sign
@@ -162,6 +184,21 @@ export class RelayerClient {
           this._apiBaseConfig
         );
       },
+      /**
+       * Stream the signed text history, fetching one page at a time as the
+       * records are consumed
+       * @param pageSize How many records to fetch per request
+       * @returns AsyncGenerator<SignedTextHistory>
+       */
+      textHistoryStream: (
+        pageSize: number = defaultPagingContext.limit
+      ): AsyncGenerator<SignedTextHistory, void, undefined> => {
+        return paginate(
+          (pagingContext) =>
+            getSignedTextHistory(this.id, pagingContext, this._apiBaseConfig),
+          pageSize
+        );
+      },
       /**
        * Sign typed data
        * @param typedData The typed data to sign
@@ -193,11 +230,30 @@ export class RelayerClient {
           this._apiBaseConfig
         );
       },
-    };
+      /**
+       * Stream the signed typed data history, fetching one page at a time as
+       * the records are consumed
+       * @param pageSize How many records to fetch per request
+       * @returns AsyncGenerator<SignedTypedDataHistory>
+       */
+      typedDataHistoryStream: (
+        pageSize: number = defaultPagingContext.limit
+      ): AsyncGenerator<SignedTypedDataHistory, void, undefined> => {
+        return paginate(
+          (pagingContext) =>
+            getSignedTypedDataHistory(
+              this.id,
+              pagingContext,
+              this._apiBaseConfig
+            ),
+          pageSize
+        );
+      },
+    });
   }
 
   public get transaction() {
-    return {
+    return cacheGetter(this, 'transaction', {
       /**
        * Get a transaction
        * @param transactionId The transaction id
@@ -310,7 +366,7 @@ export class RelayerClient {
           }
         }
       },
-    };
+    });
   }
 
   /**
@@ -330,11 +386,7 @@ export class RelayerClient {
   }
 
   private async getChainById(chainId: number) {
-    const chainEntries = Object.values(knownChains);
-    const knownChain = chainEntries.find(
-      (chain) => 'id' in chain && chain.id === chainId
-    );
-
+    const knownChain = (await getKnownChainsById()).get(chainId);
     if (knownChain) return knownChain;
 
     // Return default for unknown chains
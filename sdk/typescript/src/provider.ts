@@ -23,15 +23,28 @@ export class RpcError extends Error {
   }
 }
 
+// relayers on the same node share one viem client and its connection pool
+const publicClients = new Map<string, PublicClient>();
+
+const getPublicClient = (providerUrl: string): PublicClient => {
+  let client = publicClients.get(providerUrl);
+  if (!client) {
+    client = createPublicClient({
+      transport: http(providerUrl),
+    });
+    publicClients.set(providerUrl, client);
+  }
+
+  return client;
+};
+
 export class Provider {
   private _client: PublicClient;
   constructor(
     private _providerUrl: string,
     private _relayer: RelayerClient
   ) {
-    this._client = createPublicClient({
-      transport: http(this._providerUrl),
-    });
+    this._client = getPublicClient(this._providerUrl);
   }
 
   public async request(args: RequestArguments): Promise<unknown> {
@@ -0,0 +1,19 @@
+/**
+ * Caches a getter's result on the instance, later reads hit the own property
+ * and skip the getter
+ *
+ * The property stays configurable so a subclass getter that builds on
+ * `super` can replace the value the base getter cached
+ *
+ * @param instance - The object the getter was called on
+ * @param key - The getter name
+ * @param value - The value the getter built
+ */
+export const cacheGetter = <T>(
+  instance: object,
+  key: PropertyKey,
+  value: T
+): T => {
+  Object.defineProperty(instance, key, { value, configurable: true });
+  return value;
+};
@@ -1 +1,4 @@
+export * from './cache-getter';
 export * from './invariant';
+export * from './paginate';
+export * from './ttl-cache';
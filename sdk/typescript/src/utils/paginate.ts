@@ -0,0 +1,27 @@
+import { PagingContext, PagingResult } from '../api/types';
+
+/**
+ * Walks a paged endpoint one page at a time, the next page is only requested
+ * once the caller has consumed the current one
+ *
+ * @param fetchPage - Fetches a single page
+ * @param pageSize - How many items to request per page
+ */
+// generators can not be arrow functions
+// eslint-disable-next-line prefer-arrow/prefer-arrow-functions
+export async function* paginate<T>(
+  fetchPage: (pagingContext: PagingContext) => Promise<PagingResult<T>>,
+  pageSize: number
+): AsyncGenerator<T, void, undefined> {
+  let pagingContext: PagingContext | undefined = { limit: pageSize, offset: 0 };
+
+  while (pagingContext) {
+    const page: PagingResult<T> = await fetchPage(pagingContext);
+    yield* page.items;
+
+    // the server returns a next page for every non empty page, so a short
+    // page is already known to be the last one
+    pagingContext =
+      page.items.length < pagingContext.limit ? undefined : page.next;
+  }
+}
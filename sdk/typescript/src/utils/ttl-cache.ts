@@ -0,0 +1,42 @@
+interface TtlCacheEntry<V> {
+  expiresAt: number;
+  value: Promise<V>;
+}
+
+/**
+ * Caches async lookups by key for a fixed time, concurrent lookups for the
+ * same key share one in flight request
+ */
+export class TtlCache<K, V> {
+  private readonly _entries = new Map<K, TtlCacheEntry<V>>();
+
+  /**
+   * @param ttlMs - How long a value is served from the cache in milliseconds
+   */
+  constructor(private readonly ttlMs: number) {}
+
+  /**
+   * Returns the cached value for the key or loads it
+   *
+   * @param key - The cache key
+   * @param load - Loads the value when it is not cached or has expired
+   */
+  public get(key: K, load: () => Promise<V>): Promise<V> {
+    const now = Date.now();
+    const entry = this._entries.get(key);
+    if (entry && entry.expiresAt > now) {
+      return entry.value;
+    }
+
+    const value = load();
+    this._entries.set(key, { expiresAt: now + this.ttlMs, value });
+    // never keep a failed lookup around, the next call should retry
+    value.catch(() => {
+      if (this._entries.get(key)?.value === value) {
+        this._entries.delete(key);
+      }
+    });
+
+    return value;
+  }
+}